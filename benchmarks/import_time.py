@@ -0,0 +1,47 @@
+'''
+Measures how long `import fluentflow` takes, using `python -X importtime`.
+Run from the repository root: `python3 -m benchmarks.import_time`.
+'''
+
+import os
+import statistics
+import subprocess
+import sys
+
+
+RUNS = 20
+
+
+def parse_import_times(stderr: str) -> dict[str, int]:
+    '''Returns the cumulative import time of every fluentflow module in `-X importtime` output, in microseconds.'''
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        name = name.strip()
+        if name.startswith('fluentflow'):
+            times[name] = int(cumulative)
+    return times
+
+
+def measure_once(pythonpath: str = 'src') -> dict[str, int]:
+    '''Imports fluentflow from the given path in a new interpreter, and returns the import time of each of its modules.'''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (pythonpath, env.get('PYTHONPATH'))))
+    result = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', 'import typing, itertools, collections.abc; import fluentflow'),
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return parse_import_times(result.stderr)
+
+
+def main() -> None:
+    runs = [measure_once() for _ in range(RUNS)]
+    for name in sorted(runs[0]):
+        median = statistics.median(run[name] for run in runs)
+        print(f'{name:30} {median / 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+'''
+Times deep pagination (skip then limit) and chained slices over large lists and generators.
+Run from the repository root: `python3 -m benchmarks.slicing`.
+'''
+
+import collections
+import itertools
+import timeit
+
+from fluentflow import Flows
+
+
+SIZE = 1_000_000
+PAGE = 100
+RUNS = 20
+
+
+def _report(name: str, func) -> None:
+    best = min(timeit.repeat(func, number=1, repeat=RUNS))
+    print(f'{name:45} {best * 1e6:10.1f} us')
+
+
+def main() -> None:
+    data = list(range(SIZE))
+    flow = Flows.create(data)
+    deep = SIZE - PAGE
+
+    _report('list, islice baseline', lambda: list(itertools.islice(data, deep, deep + PAGE)))
+    _report('list, skip(deep).limit(page)', lambda: flow.skip(deep).limit(PAGE).to_list())
+    _report('list, skip(deep).limit(page).get(50)', lambda: flow.skip(deep).limit(PAGE).get(50))
+    _report('list, chained slices', lambda: flow.skip(1000).limit(deep).slice(step=3).skip(deep // 3 - PAGE).to_list())
+    _report('list, slice(-page)', lambda: flow.slice(-PAGE).to_list())
+    _report('list, islice(1, None) full pass baseline', lambda: list(itertools.islice(data, 1, None)))
+    _report('list, skip(1) full pass', lambda: flow.skip(1).to_list())
+
+    queue = Flows.create(collections.deque(data))
+    _report('deque, skip(deep).limit(page)', lambda: queue.skip(deep).limit(PAGE).to_list())
+
+    generated = Flows.calling(lambda: iter(data))
+    _report('generator, skip(deep).limit(page)', lambda: generated.skip(deep).limit(PAGE).to_list())
+    _report('generator, slice(-page)', lambda: generated.slice(-PAGE).to_list())
+
+
+if __name__ == '__main__':
+    main()
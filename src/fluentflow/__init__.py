@@ -1,10 +1,51 @@
 from .flows import Flow, Flows, EmptyFlowError
 from .iterables import Iterables
+from .memory import MemoryLimitError
+
+
+# Optional subsystems are only imported when one of their names is first used.
+# This keeps `import fluentflow` down to flows.py and iterables.py, for short-lived scripts where startup time matters.
+_lazy_names = {
+    'Checkpoint': 'checkpoints',
+    'CheckpointStore': 'checkpoints',
+    'MemoryCheckpointStore': 'checkpoints',
+    'FileCheckpointStore': 'checkpoints',
+    'FlowIndex': 'indexes',
+    'Stats': 'stats',
+    'QuantileSketch': 'stats',
+    'TDigest': 'stats',
+    'KLLSketch': 'stats',
+}
+
+
+def __getattr__(name: str):
+    module_name = _lazy_names.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
 
 __ALL__ = [
     'Flow',
     'Flows',
     'EmptyFlowError',
     'Iterables',
+    'MemoryLimitError',
+    'Checkpoint',
+    'CheckpointStore',
+    'MemoryCheckpointStore',
+    'FileCheckpointStore',
+    'FlowIndex',
+    'Stats',
+    'QuantileSketch',
+    'TDigest',
+    'KLLSketch',
 ]
-
@@ -0,0 +1,113 @@
+import typing as ty
+
+import os
+import pickle
+import tempfile
+
+
+class Checkpoint(ty.NamedTuple):
+    '''The saved progress of a resumable flow: how far into the source it got, and what it had accumulated so far.'''
+
+    operation: str
+    offset: int
+    state: ty.Any
+
+
+class CheckpointStore:
+    '''Base class for places where resumable flows save their checkpoints.'''
+
+    # Required methods (must override in subclass)
+
+    def load(self, key: str) -> Checkpoint|None:  # pragma: no cover
+        '''Returns the checkpoint saved under the given key, or None if there is none.'''
+        raise NotImplementedError()
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:  # pragma: no cover
+        raise NotImplementedError()
+
+    def clear(self, key: str) -> None:  # pragma: no cover
+        '''Removes the checkpoint saved under the given key, so that the next run starts from the beginning.'''
+        raise NotImplementedError()
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    '''Keeps checkpoints in a dictionary. Useful for tests and for long-running processes.'''
+
+    def __init__(self) -> None:
+        self._checkpoints: dict[str, Checkpoint] = {}
+
+    def load(self, key: str) -> Checkpoint|None:
+        return self._checkpoints.get(key)
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        self._checkpoints[key] = checkpoint
+
+    def clear(self, key: str) -> None:
+        self._checkpoints.pop(key, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    '''
+    Keeps one pickled checkpoint file per key in a directory.
+    Writes go to a temporary file that is then renamed over the old checkpoint, so a crash never leaves a torn file behind.
+    '''
+
+    def __init__(self, directory: str|os.PathLike[str]):
+        self._directory = os.fspath(directory)
+
+    def _path(self, key: str) -> str:
+        if not key or key in ('.', '..') or os.sep in key or (os.altsep is not None and os.altsep in key):
+            raise ValueError(f'Invalid checkpoint key: {key!r}')
+        return os.path.join(self._directory, key + '.checkpoint')
+
+    def load(self, key: str) -> Checkpoint|None:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return Checkpoint(*pickle.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        path = self._path(key)
+        os.makedirs(self._directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix='.' + key, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(tuple(checkpoint), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        _fsync_directory(self._directory)
+
+    def clear(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+def _fsync_directory(directory: str) -> None:
+    '''Makes a rename inside the directory durable. Not every platform can open a directory, so this is best effort.'''
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
+
+
+__all__ = [
+    'Checkpoint',
+    'CheckpointStore',
+    'MemoryCheckpointStore',
+    'FileCheckpointStore',
+]
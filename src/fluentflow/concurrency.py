@@ -0,0 +1,295 @@
+import typing as ty
+
+import collections
+import threading
+
+
+ElemType = ty.TypeVar('ElemType')
+ResultType = ty.TypeVar('ResultType')
+
+
+class BoundedChannel(ty.Generic[ElemType]):
+    '''
+    A first-in first-out queue that holds at most `capacity` items.
+    put blocks while the channel is full, which slows a fast producer down to the pace of its consumer.
+    Either side may close the channel. After that, put refuses new items and get drains what is left.
+    '''
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f'Capacity must be at least 1: {capacity}')
+
+        self._capacity = capacity
+        self._items: collections.deque[ElemType] = collections.deque()
+        self._closed = False
+        self._error: BaseException|None = None
+
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def full(self) -> bool:
+        return len(self._items) >= self._capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, item: ElemType) -> bool:
+        '''Adds an item, waiting for room if needed. Returns False, without adding it, if the channel is closed.'''
+        with self._not_full:
+            while not self._closed and len(self._items) >= self._capacity:
+                self._not_full.wait()
+            if self._closed:
+                return False
+            self._items.append(item)
+            self._not_empty.notify()
+            return True
+
+    def get(self) -> tuple[bool, ElemType|None]:
+        '''
+        Takes the oldest item, waiting for one if needed. Returns (True, item), or (False, None) once the channel is closed and empty.
+        If the channel was closed with an error, the error is thrown instead of returning (False, None).
+        '''
+        with self._not_empty:
+            while not self._items and not self._closed:
+                self._not_empty.wait()
+            if self._items:
+                ret = self._items.popleft()
+                self._not_full.notify()
+                return True, ret
+            if self._error is not None:
+                raise self._error
+            return False, None
+
+    def close(self, error: BaseException|None = None) -> None:
+        '''Closes the channel. If an error is given, the consumer gets it after taking the remaining items.'''
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._error = error
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+
+def _produce(it: ty.Iterable[ElemType], channel: BoundedChannel[ElemType]) -> None:
+    '''Feeds a channel from an iterable until either runs out, then closes the channel.'''
+    try:
+        for elem in it:
+            if not channel.put(elem):
+                return
+    except BaseException as e:
+        channel.close(e)
+    else:
+        channel.close()
+
+
+def _drain(channel: BoundedChannel[ElemType]) -> ty.Iterator[ElemType]:
+    while True:
+        has_item, item = channel.get()
+        if not has_item:
+            return
+        yield ty.cast(ElemType, item)
+
+
+class _BufferIterable(ty.Generic[ElemType]):
+
+    def __init__(self, parent: ty.Iterable[ElemType], size: int, threaded: bool):
+        self._parent = parent
+        self._size = size
+        self._threaded = threaded
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        channel: BoundedChannel[ElemType] = BoundedChannel(self._size)
+
+        if self._threaded:
+            producer = threading.Thread(target=_produce, args=(self._parent, channel), daemon=True)
+            producer.start()
+            try:
+                yield from _drain(channel)
+            finally:
+                # Unblocks the producer if the consumer stopped early
+                channel.close()
+            return
+
+        # Without a thread, read ahead until the channel is full, then hand out what was read
+        it = iter(self._parent)
+        while not channel.closed:
+            for elem in it:
+                channel.put(elem)
+                if channel.full:
+                    break
+            else:
+                channel.close()
+            while len(channel):
+                yield ty.cast(ElemType, channel.get()[1])
+
+
+class _TaskDone:
+    '''Put in a shared channel by a parallel_flatmap task when it has put all of its elements, or failed.'''
+
+    def __init__(self, error: BaseException|None = None):
+        self.error = error
+
+
+def _expand(
+        func: ty.Callable[[ElemType], ty.Iterable[ResultType]],
+        elem: ElemType,
+        channel: BoundedChannel[ResultType],
+    ) -> None:
+    '''Feeds one expansion into its own channel, for ordered parallel_flatmap.'''
+    try:
+        expansion = func(elem)
+    except BaseException as e:
+        channel.close(e)
+    else:
+        _produce(expansion, channel)
+
+
+def _expand_shared(
+        func: ty.Callable[[ElemType], ty.Iterable[ResultType]],
+        elem: ElemType,
+        channel: BoundedChannel[ty.Any],
+    ) -> None:
+    '''Feeds one expansion into a channel shared by every task, for unordered parallel_flatmap.'''
+    try:
+        for result in func(elem):
+            if not channel.put(result):
+                return
+    except BaseException as e:
+        channel.put(_TaskDone(e))
+    else:
+        channel.put(_TaskDone())
+
+
+class _ParallelFlatMapIterable(ty.Generic[ElemType, ResultType]):
+    '''
+    Runs up to `workers` calls of func at a time on a thread pool, and streams the elements of their results as they arrive.
+    Only `workers` expansions are in progress at once, and they hold at most `max_buffered` elements between them.
+    '''
+
+    def __init__(
+            self,
+            parent: ty.Iterable[ElemType],
+            func: ty.Callable[[ElemType], ty.Iterable[ResultType]],
+            workers: int,
+            ordered: bool,
+            max_buffered: int,
+        ):
+        self._parent = parent
+        self._func = func
+        self._workers = workers
+        self._ordered = ordered
+        self._max_buffered = max_buffered
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ResultType]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        pool = ThreadPoolExecutor(self._workers, thread_name_prefix='fluentflow-flatmap')
+        try:
+            if self._ordered:
+                yield from self._iter_ordered(pool)
+            else:
+                yield from self._iter_unordered(pool)
+        finally:
+            # Tasks that are still running stop at their next put, because their channels are closed by now
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_ordered(self, pool: ty.Any) -> ty.Iterator[ResultType]:
+        parent = iter(self._parent)
+        capacity = self._max_buffered // self._workers
+
+        # One channel per expansion in progress, oldest first
+        pending: collections.deque[BoundedChannel[ResultType]] = collections.deque()
+
+        def submit() -> None:
+            for elem in parent:
+                channel: BoundedChannel[ResultType] = BoundedChannel(capacity)
+                pool.submit(_expand, self._func, elem, channel)
+                pending.append(channel)
+                return
+
+        try:
+            for _ in range(self._workers):
+                submit()
+
+            while pending:
+                yield from _drain(pending[0])
+                pending.popleft()
+                submit()
+
+        finally:
+            for channel in pending:
+                channel.close()
+
+    def _iter_unordered(self, pool: ty.Any) -> ty.Iterator[ResultType]:
+        parent = iter(self._parent)
+        channel: BoundedChannel[ty.Any] = BoundedChannel(self._max_buffered)
+        running = 0
+
+        def submit() -> None:
+            nonlocal running
+            for elem in parent:
+                pool.submit(_expand_shared, self._func, elem, channel)
+                running = running + 1
+                return
+
+        try:
+            for _ in range(self._workers):
+                submit()
+
+            while running:
+                item = channel.get()[1]
+                if isinstance(item, _TaskDone):
+                    if item.error is not None:
+                        raise item.error
+                    running = running - 1
+                    submit()
+                else:
+                    yield ty.cast(ResultType, item)
+
+        finally:
+            channel.close()
+
+
+def parallel_flatmap(
+        it: ty.Iterable[ElemType],
+        func: ty.Callable[[ElemType], ty.Iterable[ResultType]],
+        workers: int,
+        ordered: bool = True,
+        max_buffered: int|None = None,
+    ) -> ty.Iterable[ResultType]:
+
+    if workers < 1:
+        raise ValueError(f'Need at least one worker: {workers}')
+    if max_buffered is None:
+        max_buffered = workers * 64
+    if max_buffered < workers:
+        # Ordered mode gives each expansion in progress its own share of the buffer, which must hold at least one element
+        raise ValueError(f'Buffer size must be at least the number of workers ({workers}): {max_buffered}')
+
+    return _ParallelFlatMapIterable(it, func, workers, ordered, max_buffered)
+
+
+def buffer(it: ty.Iterable[ElemType], size: int, threaded: bool = True) -> ty.Iterable[ElemType]:
+    if size < 1:
+        raise ValueError(f'Buffer size must be at least 1: {size}')
+    return _BufferIterable(it, size, threaded)
+
+
+__all__ = [
+    'BoundedChannel',
+    'buffer',
+    'parallel_flatmap',
+]
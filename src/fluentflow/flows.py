@@ -1,7 +1,14 @@
 import typing as ty
 
+from . import memory
 from .iterables import Iterables
 
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import random
+    from .checkpoints import Checkpoint, CheckpointStore
+    from .indexes import FlowIndex
+    from .stats import QuantileSketch, Stats
+
 
 ElemType = ty.TypeVar('ElemType')
 ResultType = ty.TypeVar('ResultType')
@@ -84,6 +91,69 @@ class Flow(ty.Generic[ElemType]):
         '''Removes elements from the flow that do not meet a given condition.'''
         return Flows.calling(lambda: Iterables.filter(self, func))
 
+    def parallel_flatmap(
+            self,
+            func: ty.Callable[[ElemType], ty.Iterable[ResultType]],
+            workers: int,
+            ordered: bool = True,
+            max_buffered: int|None = None,
+        ) -> 'Flow[ResultType]':
+        '''
+        Like flatmap, but calls func for up to `workers` elements at once on a thread pool. Suits functions that wait on I/O.
+        Elements of each result are passed on as soon as they arrive. If ordered, results keep the order of the elements they came from.
+        At most `max_buffered` elements (default: 64 per worker) wait between the workers and the consumer. It must be at least `workers`.
+        '''
+        from . import concurrency
+        return Flows.create(concurrency.parallel_flatmap(self, func, workers, ordered, max_buffered))
+
+    def throttle(
+            self,
+            rate: float,
+            per: float = 1.0,
+            burst: int = 1,
+            clock: ty.Callable[[], float]|None = None,
+            sleep: ty.Callable[[float], None]|None = None,
+        ) -> 'Flow[ElemType]':
+        '''
+        Slows the flow down to at most `rate` elements every `per` seconds, with bursts of up to `burst` elements (a token bucket).
+        clock and sleep default to time.monotonic and time.sleep.
+        '''
+        from . import timing
+        return Flows.create(timing.throttle(self, rate, per, burst, clock, sleep))
+
+    def debounce(self, wait: float, clock: ty.Callable[[], float]|None = None) -> 'Flow[ElemType]':
+        '''
+        Drops every element that is followed by another within `wait` seconds. The last element is always kept.
+        clock defaults to time.monotonic.
+        '''
+        from . import timing
+        return Flows.create(timing.debounce(self, wait, clock))
+
+    def buffer(self, size: int, threaded: bool = True) -> 'Flow[ElemType]':
+        '''
+        Reads up to `size` elements ahead of the consumer, and no more.
+        If threaded, a background thread reads ahead while the consumer works, and waits whenever the buffer is full.
+        Otherwise, elements are read in batches of `size`.
+        '''
+        from . import concurrency
+        return Flows.create(concurrency.buffer(self, size, threaded))
+
+    def sample_fraction(self, p: float, rng: 'random.Random|int|None' = None) -> 'Flow[ElemType]':
+        '''
+        Keeps each element with probability p, jumping over the gaps between kept elements without looking at them.
+        rng is a random.Random, or a seed. With a seed, every iteration picks the same elements.
+        '''
+        from . import sampling
+        return Flows.create(sampling.sample_fraction(self, p, rng))
+
+    def zip(self, *others: ty.Iterable[ty.Any]) -> 'Flow[tuple[ty.Any, ...]]':
+        '''Pairs up the elements of this flow with the elements of the others. Stops at the end of the shortest one.'''
+        return Flows.zip(self, *others)
+
+    def concat(self, *others: ty.Iterable[ElemType]) -> 'Flow[ElemType]':
+        '''Appends the elements of the others after the elements of this flow.'''
+        return Flows.concat(self, *others)
+
 
     # Terminal operations
 
@@ -149,13 +219,13 @@ class Flow(ty.Generic[ElemType]):
         return True
 
     def to_list(self) -> list[ElemType]:
-        return list(self)
+        return memory.collect(self, 'to_list', list)
 
     def to_tuple(self) -> tuple[ElemType]:
-        return tuple(self)
+        return memory.collect(self, 'to_tuple', tuple)
 
     def to_set(self) -> set[ElemType]:
-        return set(self)
+        return memory.collect_set(self, 'to_set')
 
     def digest(self, func: ty.Callable[[ty.Iterable[ElemType]], ResultType]) -> ResultType:
         '''
@@ -168,6 +238,97 @@ class Flow(ty.Generic[ElemType]):
         for x in self:
             func(x)
 
+    def sample(self, k: int, rng: 'random.Random|int|None' = None) -> list[ElemType]:
+        '''
+        Returns k elements chosen uniformly at random (all of them, if the flow is shorter), in one pass with Algorithm L reservoir sampling.
+        rng is a random.Random, or a seed for reproducible samples.
+        '''
+        from . import sampling
+        return sampling.sample(self, k, rng)
+
+    def sample_by(
+            self,
+            key: ty.Callable[[ElemType], KeyType],
+            k: int,
+            rng: 'random.Random|int|None' = None,
+        ) -> dict[KeyType, list[ElemType]]:
+        '''Returns a stratified sample: up to k random elements for each key.'''
+        from . import sampling
+        return sampling.sample_by(self, key, k, rng)
+
+    def stats(self) -> 'Stats':
+        '''Returns the count, sum, min, max, mean and variance of a flow of numbers, computed in one pass.'''
+        from .stats import Stats
+        ret = Stats()
+        for x in self:
+            ret.add(x)  # type: ignore[arg-type]
+        if ret.count == 0:
+            raise EmptyFlowError('Flow is empty, so it has no stats.')
+        return ret
+
+    def quantile_sketch(self, method: str = 'tdigest', **options: ty.Any) -> 'QuantileSketch':
+        '''
+        Returns a mergeable summary of a flow of numbers that estimates quantiles in bounded memory.
+        method is 'tdigest' (options: compression) or 'kll' (options: k, rng).
+        '''
+        from . import stats
+        ret = stats.sketch(method, **options)
+        for x in self:
+            ret.add(x)  # type: ignore[arg-type]
+        return ret
+
+    def quantiles(self, qs: ty.Iterable[float], method: str = 'exact', **options: ty.Any) -> list[float]:
+        '''
+        Returns the given quantiles (between 0 and 1) of a flow of numbers.
+        'exact' holds every number, within the memory budget. 'tdigest' and 'kll' estimate them in bounded memory, see quantile_sketch.
+        '''
+        from . import stats
+        qs = list(qs)
+
+        if method == 'exact':
+            data = memory.collect(self, 'quantiles', list)
+            if not data:
+                raise EmptyFlowError('Flow is empty, so it has no quantiles.')
+            return stats.exact_quantiles(data, qs)
+
+        sketch = self.quantile_sketch(method, **options)
+        if len(sketch) == 0:
+            raise EmptyFlowError('Flow is empty, so it has no quantiles.')
+        return sketch.quantiles(qs)
+
+    def histogram(
+            self,
+            bins: int|ty.Sequence[float],
+            range: tuple[float, float]|None = None,
+        ) -> tuple[list[int], list[float]]:
+        '''
+        Counts a flow of numbers into bins, like numpy.histogram. Returns the counts and the bin edges.
+        bins is either a list of edges, or a number of equal bins between range[0] and range[1].
+        Without a range, the flow's min and max are used, which takes a second pass.
+        '''
+        from . import stats
+        if isinstance(bins, int) and range is None:
+            summary = self.stats()
+            range = (summary.min, summary.max)  # type: ignore[assignment]
+        return stats.histogram(self, bins, range)  # type: ignore[arg-type]
+
+    def contains(self, elem: ElemType) -> bool:
+        '''Returns True if the flow contains the element. For repeated checks, consider `to_lookup().contains`.'''
+        return Iterables.contains(self, elem)
+
+    def index_by(self, key: ty.Callable[[ElemType], KeyType]) -> 'FlowIndex[KeyType, ElemType]':
+        '''
+        Returns an index of the flow's elements by key, built on first use.
+        Lookups by key (`get_by_key`, `contains_key`, `contains`) are O(1), and `range` queries are O(log n).
+        '''
+        from .indexes import FlowIndex
+        return FlowIndex(_unwrap(self), key)
+
+    def to_lookup(self) -> 'FlowIndex[ElemType, ElemType]':
+        '''Returns an index of the flow's elements by themselves, for repeated O(1) `contains` checks.'''
+        from .indexes import FlowIndex
+        return FlowIndex(_unwrap(self))
+
 
 
 #
@@ -189,6 +350,15 @@ class _IterableFlow(Flow[ElemType]):
     def distinct(self) -> Flow[ElemType]:
         return Flows.calling(lambda: Iterables.distinct(self._data))
 
+    def slice(
+        self,
+        start: int|None = None,
+        stop: int|None = None,
+        step: int|None = None,
+    ) -> Flow[ElemType]:
+        # Slice the data itself, so that sequences keep random access and chained slices fold into one
+        return Flows.create(Iterables.slice(self._data, start=start, stop=stop, step=step))
+
     def reverse(self) -> Flow[ElemType]:
         return Flows.calling(lambda: Iterables.reverse(self._data))
 
@@ -199,6 +369,124 @@ class _IterableFlow(Flow[ElemType]):
         return Iterables.get(self._data, index)
 
 
+class _CountingIterator(ty.Generic[ElemType]):
+    '''Decorates an iterator to remember how many elements have been taken from it.'''
+
+    def __init__(self, parent: ty.Iterator[ElemType]):
+        self.count = 0
+        self._parent = parent
+
+    def __iter__(self) -> ty.Self:  # pragma: no cover
+        return self
+
+    def __next__(self) -> ElemType:
+        ret = next(self._parent)
+        self.count = self.count + 1
+        return ret
+
+
+class _ResumableFlow(Flow[ElemType]):
+    '''
+    A flow over an append-only source that remembers how far into the source it got.
+    Iterating it yields only the elements after the saved offset.
+    The checkpointing terminals (count, reduce) merge those elements into the saved result and then save the new offset.
+    map, filter and flatmap keep the flow resumable. Other modifying operations return ordinary flows over the new elements.
+    '''
+
+    def __init__(
+            self,
+            source: ty.Iterable[ty.Any],
+            store: 'CheckpointStore',
+            key: str,
+            pipeline: ty.Callable[[ty.Iterable[ty.Any]], ty.Iterable[ElemType]],
+        ):
+        self._source = source
+        self._store = store
+        self._key = key
+        self._pipeline = pipeline
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        checkpoint = self._store.load(self._key)
+        offset = 0 if checkpoint is None else checkpoint.offset
+        return iter(self._pipeline(self._new_elements(offset)))
+
+    def _new_elements(self, offset: int) -> ty.Iterable[ty.Any]:
+        # Sequences get a view that starts at the offset, so old elements are never read
+        return Iterables.slice(self._source, start=offset)
+
+    def _then(self, stage: ty.Callable[[ty.Iterable[ElemType]], ty.Iterable[ResultType]]) -> '_ResumableFlow[ResultType]':
+        pipeline = self._pipeline
+        return _ResumableFlow(self._source, self._store, self._key, lambda it: stage(pipeline(it)))
+
+    def _resume(self, operation: str) -> tuple['Checkpoint|None', _CountingIterator[ty.Any], ty.Iterator[ElemType]]:
+        checkpoint = self._store.load(self._key)
+        if checkpoint is not None and checkpoint.operation != operation:
+            raise ValueError(f'Checkpoint {self._key!r} was saved by {checkpoint.operation}, not {operation}')
+
+        offset = 0 if checkpoint is None else checkpoint.offset
+        source = _CountingIterator(iter(self._new_elements(offset)))
+        return checkpoint, source, iter(self._pipeline(source))
+
+    def _commit(self, operation: str, checkpoint: 'Checkpoint|None', source: _CountingIterator[ty.Any], state: ty.Any) -> None:
+        from .checkpoints import Checkpoint
+
+        offset = 0 if checkpoint is None else checkpoint.offset
+        self._store.save(self._key, Checkpoint(operation, offset + source.count, state))
+
+    def map(self, func: ty.Callable[[ElemType], ResultType]) -> Flow[ResultType]:
+        return self._then(lambda it: Iterables.map(it, func))
+
+    def flatmap(self, func: ty.Callable[[ElemType], ty.Iterable[ResultType]]) -> Flow[ResultType]:
+        return self._then(lambda it: Iterables.flatmap(it, func))
+
+    def filter(self, func: ty.Callable[[ElemType], bool]) -> Flow[ElemType]:
+        return self._then(lambda it: Iterables.filter(it, func))
+
+    def reduce(self, func, start = _missing):
+        '''Folds the new elements into the saved result. On the first run this behaves like Flow.reduce.'''
+
+        checkpoint, source, it = self._resume('reduce')
+
+        if checkpoint is not None:
+            ret = checkpoint.state
+        elif start is _missing:
+            try:
+                ret = next(it)
+            except StopIteration as e:
+                raise EmptyFlowError('Flow is empty, and no initial value was given.') from e
+        else:
+            ret = start
+
+        for elem in it:
+            ret = func(ret, elem)
+
+        self._commit('reduce', checkpoint, source, ret)
+        return ret
+
+    def count(self) -> int:
+        '''Returns the saved count plus the number of new elements.'''
+
+        checkpoint, source, it = self._resume('count')
+
+        ret = 0 if checkpoint is None else checkpoint.state
+        for elem in it:
+            ret = ret + 1
+
+        self._commit('count', checkpoint, source, ret)
+        return ret
+
+    def reset(self) -> None:
+        '''Forgets the saved checkpoint, so that the next run processes the whole source again.'''
+        self._store.clear(self._key)
+
+
+def _unwrap(it: ty.Iterable[ElemType]) -> ty.Iterable[ElemType]:
+    '''Returns the data behind a flow, so that operations can see whether it is a sequence.'''
+    if isinstance(it, _IterableFlow):
+        return it._data
+    return it
+
+
 #
 # Flow factory
 #
@@ -223,6 +511,69 @@ class Flows:
     def calling(func: ty.Callable[[], ty.Iterable[ElemType]]) -> Flow[ElemType]:
         return Flows.create(Iterables.calling(func))
 
+    @staticmethod
+    def zip(*its: ty.Iterable[ty.Any]) -> Flow[tuple[ty.Any, ...]]:
+        '''Creates a flow of tuples, like the builtin zip. Supports len and random access if every input does.'''
+        return Flows.create(Iterables.zip(*map(_unwrap, its)))
+
+    @staticmethod
+    def concat(*its: ty.Iterable[ElemType]) -> Flow[ElemType]:
+        '''Creates a flow of the elements of every input, one input after another.'''
+        return Flows.create(Iterables.concat(*map(_unwrap, its)))
+
+    @staticmethod
+    def interleave(*its: ty.Iterable[ElemType]) -> Flow[ElemType]:
+        '''Creates a flow that takes one element from each input in turn, until every input runs out.'''
+        return Flows.create(Iterables.interleave(*map(_unwrap, its)))
+
+    @staticmethod
+    def merge_sorted(
+            *its: ty.Iterable[ElemType],
+            key: ty.Callable[[ElemType], ty.Any]|None = None,
+            reverse: bool = False,
+        ) -> Flow[ElemType]:
+        '''
+        Creates a sorted flow from inputs that are each already sorted.
+        Only one element of each input is held at a time.
+        If every input has a length, `count` is instant. `get` and the other positional operations still walk the merge.
+        '''
+        return Flows.create(Iterables.merge_sorted(*map(_unwrap, its), key=key, reverse=reverse))
+
+    @staticmethod
+    def resumable(source: ty.Iterable[ElemType], store: 'CheckpointStore', key: str = 'default') -> Flow[ElemType]:
+        '''
+        Creates a flow over an append-only source that only processes elements added since the last run.
+        The offset and result of count or reduce are saved in the store under the given key.
+        Sequence sources (lists, tuples, ...) jump straight to the offset. Other iterables are walked from the start, and the old elements skipped.
+        Example: `Flows.resumable(Flows.calling(read_log), FileCheckpointStore('checkpoints')).count()`.
+        '''
+        return _ResumableFlow(_unwrap(source), store, key, lambda it: it)
+
+    @staticmethod
+    def configure(
+            memory_limit: int|None = memory._missing,
+            spill_to_disk: bool = memory._missing,
+            spill_directory: str|None = memory._missing,
+            track_memory: bool = memory._missing,
+        ) -> None:
+        '''
+        Changes how operations that hold many elements at once (reverse, distinct, get with a negative index, to_list, to_set, to_tuple) use memory.
+        memory_limit is the most bytes any one of these operations may hold, approximated with sys.getsizeof.
+        Past the limit, reverse writes its elements to a temporary file if spill_to_disk is set. This needs elements that can be pickled.
+        reverse without spill_to_disk, reverse of elements that cannot be pickled, and every other operation throw MemoryLimitError instead.
+        Settings that are not given keep their value.
+        '''
+        memory.configure(limit=memory_limit, spill=spill_to_disk, spill_directory=spill_directory, track=track_memory)
+
+    @staticmethod
+    def memory_usage() -> dict[str, int]:
+        '''Returns the peak approximate bytes held by each operation, recorded while a memory limit or track_memory is set.'''
+        return memory.budget().peak_usage()
+
+    @staticmethod
+    def reset_memory_usage() -> None:
+        memory.budget().reset_peak_usage()
+
 
 __all__ = [
     'Flow',
@@ -0,0 +1,102 @@
+import typing as ty
+
+import bisect
+import collections.abc
+
+
+ElemType = ty.TypeVar('ElemType')
+KeyType = ty.TypeVar('KeyType')
+
+
+class FlowIndex(ty.Generic[KeyType, ElemType]):
+    '''
+    Groups the elements of a flow by key, so that repeated lookups do not go through the flow again.
+    The hash index is built on the first lookup. The sorted index used by `range` is built on the first range query.
+
+    If the flow's data has a length (a list, set, ...), the index is rebuilt when that length changes.
+    Changes that keep the length the same (such as `data[0] = x`) are not noticed: call `invalidate` after making them.
+    '''
+
+    def __init__(
+            self,
+            source: ty.Iterable[ElemType],
+            key: ty.Callable[[ElemType], KeyType]|None = None,
+        ):
+        self._source = source
+        self._key = key
+
+        self._groups: dict[KeyType, list[ElemType]]|None = None
+        # Typed loosely: KeyType is not known to be comparable, but range requires it
+        self._sorted_keys: list[ty.Any]|None = None
+        self._built_length: int|None = None
+
+    def invalidate(self) -> None:
+        '''Throws away the index, so that the next lookup rebuilds it from the flow.'''
+        self._groups = None
+        self._sorted_keys = None
+
+    def _current_length(self) -> int|None:
+        if isinstance(self._source, collections.abc.Sized):
+            return len(self._source)
+        return None
+
+    def _get_groups(self) -> dict[KeyType, list[ElemType]]:
+        if self._groups is not None and self._built_length != self._current_length():
+            self.invalidate()
+
+        if self._groups is None:
+            groups: dict[KeyType, list[ElemType]] = {}
+            key = self._key
+            for elem in self._source:
+                groups.setdefault(ty.cast(KeyType, elem) if key is None else key(elem), []).append(elem)
+            self._groups = groups
+            self._built_length = self._current_length()
+
+        return self._groups
+
+    def _get_sorted_keys(self) -> list[ty.Any]:
+        groups = self._get_groups()
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(groups)
+        return self._sorted_keys
+
+    def __len__(self) -> int:
+        '''Returns the number of distinct keys.'''
+        return len(self._get_groups())
+
+    def keys(self) -> ty.KeysView[KeyType]:
+        return self._get_groups().keys()
+
+    def get_by_key(self, key: KeyType) -> tuple[ElemType, ...]:
+        '''Returns every element with the given key, in flow order. Returns an empty tuple if there are none.'''
+        return tuple(self._get_groups().get(key, ()))
+
+    def contains_key(self, key: KeyType) -> bool:
+        return key in self._get_groups()
+
+    def contains(self, elem: ElemType) -> bool:
+        '''Returns True if the flow contains the element. Looks in the element's group only.'''
+        key = ty.cast(KeyType, elem) if self._key is None else self._key(elem)
+        group = self._get_groups().get(key)
+        return group is not None and (self._key is None or elem in group)
+
+    def range(self, low: KeyType|None = None, high: KeyType|None = None) -> list[ElemType]:
+        '''
+        Returns every element with a key from low (inclusive) to high (exclusive), ordered by key.
+        Leaving out low or high leaves that end open. Keys must be comparable with each other.
+        '''
+        groups = self._get_groups()
+        keys = self._get_sorted_keys()
+
+        start = 0 if low is None else bisect.bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect.bisect_left(keys, high)
+
+        ret: list[ElemType] = []
+        for key in keys[start:stop]:
+            ret.extend(groups[key])
+        return ret
+
+
+__all__ = [
+    'FlowIndex',
+]
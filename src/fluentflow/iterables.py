@@ -1,8 +1,11 @@
 import typing as ty
 
+import collections
 import collections.abc
 import itertools
 
+from . import memory
+
 ElemType = ty.TypeVar('ElemType')
 ResultType = ty.TypeVar('ResultType')
 
@@ -37,9 +40,10 @@ class _CallingIterable(ty.Generic[ElemType]):
 class _ThroughSetIterator(ty.Generic[ElemType]):
     '''Decorates an iterator to send all of its elements through a set so that duplicate elements are discarded.'''
 
-    def __init__(self, parent: ty.Iterator[ElemType]):
+    def __init__(self, parent: ty.Iterator[ElemType], tracker: memory.MemoryTracker|None = None):
         self._already: set[ElemType] = set()
         self._parent = parent
+        self._tracker = tracker
 
     def __iter__(self) -> ty.Self:  # pragma: no cover
         return self
@@ -49,6 +53,8 @@ class _ThroughSetIterator(ty.Generic[ElemType]):
             ret = next(self._parent)
             if ret in self._already:
                 continue
+            if self._tracker is not None:
+                self._tracker.require(ret)
             self._already.add(ret)
             return ret
 
@@ -62,7 +68,8 @@ class _ThroughSetIterable(ty.Generic[ElemType]):
         raise TypeError('Call __iter__ first')
 
     def __iter__(self) -> ty.Iterator[ElemType]:
-        return _ThroughSetIterator(iter(self._parent))
+        tracker = memory.budget().tracker('distinct', memory.SET_SLOT_SIZE)
+        return _ThroughSetIterator(iter(self._parent), tracker)
 
 
 class _ReversedIterable(ty.Generic[ElemType]):
@@ -76,7 +83,7 @@ class _ReversedIterable(ty.Generic[ElemType]):
     def __iter__(self) -> ty.Iterator[ElemType]:
         if isinstance(self._parent, collections.abc.Reversible):
             return reversed(self._parent)
-        return iter(reversed(tuple(self._parent)))
+        return memory.reversed_within_budget(self._parent)
 
 
 class _FlatMapIterator(ty.Generic[ElemType, ResultType]):
@@ -124,6 +131,289 @@ class _FlatMapIterable(ty.Generic[ElemType, ResultType]):
         return _FlatMapIterator(iter(self._parent), self._func)
 
 
+def _normalize_index(index: int, length: int) -> int:
+    if index < 0:
+        index = index + length
+    if index < 0 or index >= length:
+        raise IndexError(str(index))
+    return index
+
+
+class _ZipSequence(collections.abc.Sequence):
+    '''A lazy view that pairs up the elements of several sequences, like zip. Its length is the length of the shortest parent.'''
+
+    def __init__(self, parents: tuple[collections.abc.Sequence, ...]):
+        self._parents = parents
+
+    def __len__(self) -> int:
+        return min((len(parent) for parent in self._parents), default=0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(len(self))[index])
+        index = _normalize_index(index, len(self))
+        return tuple(parent[index] for parent in self._parents)
+
+    def __iter__(self) -> ty.Iterator[tuple[ty.Any, ...]]:
+        return zip(*self._parents)
+
+
+class _ConcatSequence(collections.abc.Sequence):
+    '''A lazy view of several sequences one after another.'''
+
+    def __init__(self, parents: tuple[collections.abc.Sequence, ...]):
+        self._parents = parents
+
+    def __len__(self) -> int:
+        return sum(len(parent) for parent in self._parents)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(len(self))[index])
+        index = _normalize_index(index, len(self))
+        for parent in self._parents:
+            if index < len(parent):
+                return parent[index]
+            index = index - len(parent)
+        raise IndexError(str(index))  # pragma: no cover
+
+    def __iter__(self) -> ty.Iterator[ty.Any]:
+        return itertools.chain.from_iterable(self._parents)
+
+
+class _InterleaveSequence(collections.abc.Sequence):
+    '''
+    A lazy view that takes one element from each sequence in turn.
+    Sequences that run out are left out of later rounds.
+    '''
+
+    def __init__(self, parents: tuple[collections.abc.Sequence, ...]):
+        self._parents = parents
+
+    def __len__(self) -> int:
+        return sum(len(parent) for parent in self._parents)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(len(self))[index])
+        index = _normalize_index(index, len(self))
+
+        # Skip whole blocks of rounds that have the same parents taking part
+        active = [parent for parent in self._parents if len(parent) > 0]
+        done_rounds = 0
+        while True:
+            shortest = min(len(parent) for parent in active)
+            block = (shortest - done_rounds) * len(active)
+            if index < block:
+                return active[index % len(active)][done_rounds + index // len(active)]
+            index = index - block
+            done_rounds = shortest
+            active = [parent for parent in active if len(parent) > shortest]
+
+    def __iter__(self) -> ty.Iterator[ty.Any]:
+        return _interleave(self._parents)
+
+
+def _interleave(parents: ty.Iterable[ty.Iterable[ElemType]]) -> ty.Iterator[ElemType]:
+    iterators = [iter(parent) for parent in parents]
+    while iterators:
+        alive = []
+        for it in iterators:
+            try:
+                elem = next(it)
+            except StopIteration:
+                continue
+            alive.append(it)
+            yield elem
+        iterators = alive
+
+
+class _CombiningIterable(ty.Generic[ElemType]):
+    '''Calls a function that combines several iterables every time it is iterated.'''
+
+    def __init__(
+            self,
+            func: ty.Callable[..., ty.Iterator[ElemType]],
+            parents: tuple[ty.Iterable[ty.Any], ...],
+        ):
+        self._func = func
+        self._parents = parents
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        return self._func(*self._parents)
+
+
+class _SizedCombiningIterable(_CombiningIterable[ElemType]):
+    '''A combining iterable whose length is the total length of its parents.'''
+
+    def __len__(self) -> int:
+        return sum(len(ty.cast(collections.abc.Sized, parent)) for parent in self._parents)
+
+
+def _merge_sorted(
+        key: ty.Callable[[ty.Any], ty.Any]|None,
+        reverse: bool,
+    ) -> ty.Callable[..., ty.Iterator[ty.Any]]:
+
+    def merge(*parents: ty.Iterable[ty.Any]) -> ty.Iterator[ty.Any]:
+        import heapq
+        return heapq.merge(*parents, key=key, reverse=reverse)
+
+    return merge
+
+
+# Sequences that can be indexed in constant time. Slices of these are kept as lazy views.
+# Other sequences, such as deques (which index in linear time), are sliced like any other iterable.
+_RANDOM_ACCESS = (list, tuple, str, bytes, range, _ZipSequence, _ConcatSequence, _InterleaveSequence)
+
+# Sequences whose own slicing copies elements out faster than indexing them one by one
+_NATIVE_SLICING = (list, tuple, str, bytes)
+
+# How many elements a slice view copies out of its sequence at a time
+_SLICE_CHUNK = 1024
+
+
+def _native_slices(parent: ty.Any, indices: range) -> ty.Iterator[ty.Any]:
+    '''Goes through the given indices of the sequence a chunk at a time, so that stopping early does not copy the whole slice.'''
+
+    def chunks() -> ty.Iterator[ty.Any]:
+        for i in range(0, len(indices), _SLICE_CHUNK):
+            chunk = indices[i:i + _SLICE_CHUNK]
+            # A range going down to index 0 stops at -1, which a slice would read as the last element
+            yield parent[chunk.start:chunk.stop if chunk.stop >= 0 else None:chunk.step]
+
+    return itertools.chain.from_iterable(chunks())
+
+
+class _SequenceSlice(collections.abc.Sequence):
+    '''
+    A lazy view of a slice of a sequence. Slicing the view again adds to its list of slices instead of nesting views.
+    The indices are worked out when the view is used, so the view follows changes to the sequence.
+    '''
+
+    def __init__(self, parent: collections.abc.Sequence, slices: tuple[slice, ...]):
+        self._parent = parent
+        self._slices = slices
+
+    def _indices(self) -> range:
+        ret = range(len(self._parent))
+        for s in self._slices:
+            ret = ret[s]
+        return ret
+
+    def __len__(self) -> int:
+        return len(self._indices())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _SequenceSlice(self._parent, self._slices + (index,))
+        return self._parent[self._indices()[index]]
+
+    def _iter_indices(self, indices: range) -> ty.Iterator[ty.Any]:
+        if isinstance(self._parent, _NATIVE_SLICING):
+            return _native_slices(self._parent, indices)
+        return map(self._parent.__getitem__, indices)
+
+    def __iter__(self) -> ty.Iterator[ty.Any]:
+        return self._iter_indices(self._indices())
+
+    def __reversed__(self) -> ty.Iterator[ty.Any]:
+        return self._iter_indices(self._indices()[::-1])
+
+
+class _SliceIterable(ty.Generic[ElemType]):
+    '''A reusable islice. Slicing it again folds both slices into one islice.'''
+
+    def __init__(self, parent: ty.Iterable[ElemType], start: int, stop: int|None, step: int):
+        self._parent = parent
+        self._start = start
+        self._stop = stop
+        self._step = step
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        return itertools.islice(self._parent, self._start, self._stop, self._step)
+
+    def then(self, start: int, stop: int|None, step: int) -> ty.Iterable[ElemType]:
+        '''Returns the slice of this slice, as one slice of the parent. All arguments must not be negative.'''
+
+        # Element i of this slice is element (self._start + i * self._step) of the parent
+        new_start = self._start + start * self._step
+        stops = [x for x in (self._stop, None if stop is None else self._start + stop * self._step) if x is not None]
+        new_stop = min(stops) if stops else None
+
+        if new_stop is not None and new_start >= new_stop:
+            return Iterables.empty()
+
+        return _SliceIterable(self._parent, new_start, new_stop, self._step * step)
+
+
+def _delayed(it: ty.Iterable[ElemType], delay: int) -> ty.Iterator[ElemType]:
+    '''Yields every element except the last `delay`, holding only `delay` elements at a time.'''
+    window: collections.deque[ElemType] = collections.deque()
+    tracker = memory.budget().tracker('slice')
+    for elem in it:
+        window.append(elem)
+        if len(window) > delay:
+            yield window.popleft()
+        elif tracker is not None:
+            tracker.require(elem)
+
+
+class _BufferedSliceIterable(ty.Generic[ElemType]):
+    '''
+    Slices an iterable that has no length or random access, for slices that count from the end or go backwards.
+    Only the elements that the slice could need are held: a delay line, the last few elements, or the first few elements.
+    Slices that need an unbounded part of the iterable hold all of it, within the memory budget.
+    '''
+
+    def __init__(self, parent: ty.Iterable[ElemType], start: int|None, stop: int|None, step: int):
+        self._parent = parent
+        self._slice = slice(start, stop, step)
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        start, stop, step = self._slice.start, self._slice.stop, self._slice.step
+
+        if step > 0:
+            if start is None or start >= 0:
+                # Only the stop counts from the end
+                return itertools.islice(_delayed(self._parent, -ty.cast(int, stop)), start, None, step)
+            return self._from_tail(-start)
+
+        if start is not None and start >= 0 and (stop is None or stop >= 0):
+            # Going backwards from a fixed index only needs the elements up to it
+            head = memory.collect(itertools.islice(self._parent, start + 1), 'slice', list)
+            return iter(head[self._slice])
+
+        if stop is not None and stop < 0:
+            return self._from_tail(-stop - 1)
+
+        return self._from_tail(None)
+
+    def _from_tail(self, size: int|None) -> ty.Iterator[ElemType]:
+        '''Keeps the last `size` elements (or all of them), then picks the slice out of them.'''
+
+        window: collections.deque[ElemType] = collections.deque(maxlen=size)
+        tracker = memory.budget().tracker('slice')
+        count = 0
+        for elem in self._parent:
+            if tracker is not None and (size is None or len(window) < size):
+                tracker.require(elem)
+            window.append(elem)
+            count = count + 1
+
+        offset = count - len(window)
+        return (window[i - offset] for i in range(count)[self._slice])
+
+
 class Iterables:
 
     @staticmethod
@@ -166,6 +456,38 @@ class Iterables:
     def filter(it: ty.Iterable[ElemType], func: ty.Callable[[ElemType], bool]) -> ty.Iterable[ElemType]:
         return filter(func, it)
 
+    @staticmethod
+    def zip(*its: ty.Iterable[ty.Any]) -> ty.Iterable[tuple[ty.Any, ...]]:
+        if all(isinstance(it, collections.abc.Sequence) for it in its):
+            return _ZipSequence(ty.cast(tuple[collections.abc.Sequence, ...], its))
+        return _CombiningIterable(zip, its)
+
+    @staticmethod
+    def concat(*its: ty.Iterable[ElemType]) -> ty.Iterable[ElemType]:
+        if all(isinstance(it, collections.abc.Sequence) for it in its):
+            return _ConcatSequence(ty.cast(tuple[collections.abc.Sequence, ...], its))
+        return _CombiningIterable(itertools.chain, its)
+
+    @staticmethod
+    def interleave(*its: ty.Iterable[ElemType]) -> ty.Iterable[ElemType]:
+        if all(isinstance(it, collections.abc.Sequence) for it in its):
+            return _InterleaveSequence(ty.cast(tuple[collections.abc.Sequence, ...], its))
+        return _CombiningIterable(lambda *parents: _interleave(parents), its)
+
+    @staticmethod
+    def merge_sorted(
+            *its: ty.Iterable[ElemType],
+            key: ty.Callable[[ElemType], ty.Any]|None = None,
+            reverse: bool = False,
+        ) -> ty.Iterable[ElemType]:
+        '''
+        Merges iterables that are each already sorted, holding only one element of each at a time.
+        If every iterable has a length, so does the result. It has no random access, so getting an element walks the merge up to it.
+        '''
+        if all(isinstance(it, collections.abc.Sized) for it in its):
+            return _SizedCombiningIterable(_merge_sorted(key, reverse), its)
+        return _CombiningIterable(_merge_sorted(key, reverse), its)
+
     @staticmethod
     def reverse(it: ty.Iterable[ElemType]) -> ty.Iterable[ElemType]:
         return _ReversedIterable(it)
@@ -192,22 +514,34 @@ class Iterables:
             step: int|None = None,
         ) -> ty.Iterable[ElemType]:
 
-        if start is None:
-            start = 0
-
         if step is None:
             step = 1
 
-        if start == 0 and stop is None and step == 1:
+        if step == 0:
+            raise ValueError('Slice step cannot be zero')
+
+        if (start is None or start == 0) and stop is None and step == 1:
             return it
 
+        if isinstance(it, (range, _SequenceSlice)):
+            return it[start:stop:step]
+
+        if isinstance(it, _RANDOM_ACCESS):
+            return _SequenceSlice(it, (slice(start, stop, step),))
+
+        if step < 0 or (start is not None and start < 0) or (stop is not None and stop < 0):
+            return _BufferedSliceIterable(it, start, stop, step)
+
+        if start is None:
+            start = 0
+
         if stop is not None and start >= stop:
             return Iterables.empty()
 
-        if step < 0:
-            return Iterables.slice(Iterables.reverse(it), start, stop, -step)
+        if isinstance(it, _SliceIterable):
+            return it.then(start, stop, step)
 
-        return itertools.islice(it, start, stop, step)
+        return _SliceIterable(it, start, stop, step)
 
     @staticmethod
     def get(it: ty.Iterable[ElemType], index: int) -> ElemType:
@@ -216,10 +550,16 @@ class Iterables:
             return it[index]
 
         if index < 0:
-            new_index = Iterables.count(it) + index
-            if new_index < 0:
+            # Keep a window of the last elements instead of going through the iterable twice
+            window: collections.deque[ElemType] = collections.deque(maxlen=-index)
+            tracker = memory.budget().tracker('get')
+            for elem in it:
+                if tracker is not None and len(window) < -index:
+                    tracker.require(elem)
+                window.append(elem)
+            if len(window) < -index:
                 raise IndexError(str(index))
-            index = new_index
+            return window[0]
 
         for elem_index, elem in enumerate(iter(it)):
             if elem_index == index:
@@ -0,0 +1,238 @@
+import typing as ty
+
+import sys
+
+
+ElemType = ty.TypeVar('ElemType')
+
+
+# Placeholder for when None as a default argument won't suffice
+_missing: ty.Any = object()
+
+
+# Approximate cost of the pointer slot that a container keeps for each element
+LIST_SLOT_SIZE = 8
+SET_SLOT_SIZE = 24
+
+
+class MemoryLimitError(MemoryError):
+    '''Thrown when a materializing operation would hold more memory than the configured limit.'''
+    pass
+
+
+class MemoryBudget:
+    '''
+    Settings for operations that have to hold many elements at once (reverse, distinct, get with a negative index, to_list, to_set, to_tuple).
+    The limit applies to each operation on its own. Sizes are approximated with sys.getsizeof.
+    '''
+
+    def __init__(
+            self,
+            limit: int|None = None,
+            spill: bool = False,
+            spill_directory: str|None = None,
+            track: bool = False,
+        ):
+        self.limit = limit
+        self.spill = spill
+        self.spill_directory = spill_directory
+        self.track = track
+        self._peaks: dict[str, int] = {}
+
+    @property
+    def active(self) -> bool:
+        return self.limit is not None or self.track
+
+    def tracker(self, operator: str, slot_size: int = LIST_SLOT_SIZE) -> 'MemoryTracker|None':
+        '''Returns a tracker for one run of the given operator, or None if memory is not being accounted.'''
+        if not self.active:
+            return None
+        return MemoryTracker(self, operator, slot_size)
+
+    def peak_usage(self) -> dict[str, int]:
+        '''Returns the most bytes that any run of each operator has held.'''
+        return dict(self._peaks)
+
+    def reset_peak_usage(self) -> None:
+        self._peaks.clear()
+
+
+class MemoryTracker:
+    '''Adds up the approximate size of the elements that one run of an operator is holding.'''
+
+    def __init__(self, budget: MemoryBudget, operator: str, slot_size: int):
+        self.size = 0
+        self._budget = budget
+        self._operator = operator
+        self._slot_size = slot_size
+        self._peak = 0
+
+    def add(self, elem: ty.Any) -> bool:
+        '''Accounts for one more held element. Returns False if the operator now holds more than the limit.'''
+        self.size = self.size + sys.getsizeof(elem) + self._slot_size
+
+        if self.size > self._peak:
+            self._peak = self.size
+            if self._peak > self._budget._peaks.get(self._operator, 0):
+                self._budget._peaks[self._operator] = self._peak
+
+        limit = self._budget.limit
+        return limit is None or self.size <= limit
+
+    def require(self, elem: ty.Any) -> None:
+        '''Accounts for one more held element. Throws MemoryLimitError if the operator now holds more than the limit.'''
+        if not self.add(elem):
+            raise MemoryLimitError(
+                f'{self._operator} holds about {self.size} bytes, more than the limit of {self._budget.limit} bytes'
+            )
+
+    def clear(self) -> None:
+        '''Forgets the held elements, for example after they have been written to disk.'''
+        self.size = 0
+
+
+_budget = MemoryBudget()
+
+
+def budget() -> MemoryBudget:
+    '''Returns the process-wide memory budget.'''
+    return _budget
+
+
+def configure(
+        limit: int|None = _missing,
+        spill: bool = _missing,
+        spill_directory: str|None = _missing,
+        track: bool = _missing,
+    ) -> None:
+    '''Changes the given settings of the process-wide memory budget. Settings that are not given keep their value.'''
+
+    if limit is not _missing:
+        if limit is not None and limit < 0:
+            raise ValueError(f'Memory limit cannot be negative: {limit}')
+        _budget.limit = limit
+
+    if spill is not _missing:
+        _budget.spill = spill
+
+    if spill_directory is not _missing:
+        _budget.spill_directory = spill_directory
+
+    if track is not _missing:
+        _budget.track = track
+
+
+def collect(
+        it: ty.Iterable[ElemType],
+        operator: str,
+        factory: ty.Callable[[ty.Iterable[ElemType]], ty.Any],
+    ) -> ty.Any:
+    '''Builds a list or tuple from the iterable, staying within the memory budget.'''
+
+    tracker = _budget.tracker(operator)
+    if tracker is None:
+        return factory(it)
+
+    ret = []
+    for elem in it:
+        tracker.require(elem)
+        ret.append(elem)
+    return ret if factory is list else factory(ret)
+
+
+def collect_set(it: ty.Iterable[ElemType], operator: str) -> set[ElemType]:
+    '''Builds a set from the iterable, staying within the memory budget. Duplicates do not count towards the limit.'''
+
+    tracker = _budget.tracker(operator, SET_SLOT_SIZE)
+    if tracker is None:
+        return set(it)
+
+    ret: set[ElemType] = set()
+    for elem in it:
+        if elem not in ret:
+            tracker.require(elem)
+            ret.add(elem)
+    return ret
+
+
+def reversed_within_budget(it: ty.Iterable[ElemType]) -> ty.Iterator[ElemType]:
+    '''
+    Returns an iterator over the elements of the iterable in reverse order.
+    If the elements do not fit in the memory budget, they are either spilled to a temporary file or MemoryLimitError is thrown.
+    Spilling pickles the elements, so elements that cannot be pickled also get MemoryLimitError.
+    '''
+
+    tracker = _budget.tracker('reverse')
+    if tracker is None:
+        return iter(reversed(tuple(it)))
+
+    chunk: list[ElemType] = []
+    source = iter(it)
+
+    for elem in source:
+        chunk.append(elem)
+        if not tracker.add(elem):
+            if not _budget.spill:
+                raise MemoryLimitError(
+                    f'reverse holds about {tracker.size} bytes, more than the limit of {_budget.limit} bytes'
+                )
+            return _spilled_reversed(chunk, source, tracker)
+
+    return iter(reversed(chunk))
+
+
+def _spilled_reversed(
+        chunk: list[ElemType],
+        rest: ty.Iterator[ElemType],
+        tracker: MemoryTracker,
+    ) -> ty.Iterator[ElemType]:
+    '''Writes the elements to a temporary file in chunks that fit the budget, then reads the chunks back last to first.'''
+
+    import pickle
+    import tempfile
+
+    f = tempfile.TemporaryFile(dir=_budget.spill_directory)
+
+    try:
+        offsets = []
+
+        def flush() -> None:
+            offsets.append(f.tell())
+            try:
+                pickle.dump(chunk, f, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                raise MemoryLimitError(
+                    f'reverse holds more than the limit of {_budget.limit} bytes, and its elements cannot be spilled to disk because they cannot be pickled: {e}'
+                ) from e
+            chunk.clear()
+            tracker.clear()
+
+        flush()
+        for elem in rest:
+            chunk.append(elem)
+            if not tracker.add(elem):
+                flush()
+        if chunk:
+            flush()
+
+    except BaseException:
+        f.close()
+        raise
+
+    return _read_chunks_reversed(f, offsets)
+
+
+def _read_chunks_reversed(f: ty.BinaryIO, offsets: list[int]) -> ty.Iterator[ty.Any]:
+    import pickle
+
+    with f:
+        for offset in reversed(offsets):
+            f.seek(offset)
+            yield from reversed(pickle.load(f))
+
+
+__all__ = [
+    'MemoryLimitError',
+    'MemoryBudget',
+    'MemoryTracker',
+]
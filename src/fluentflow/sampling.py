@@ -0,0 +1,154 @@
+import typing as ty
+
+import itertools
+import math
+import random
+
+
+ElemType = ty.TypeVar('ElemType')
+KeyType = ty.TypeVar('KeyType')
+
+
+# A random.Random, a seed for a new one, or None for an unseeded one
+Rng = ty.Union[random.Random, int, None]
+
+
+# Placeholder for when None as a default argument won't suffice
+_missing: ty.Any = object()
+
+
+def _make_rng(rng: Rng) -> random.Random:
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+
+def _uniform(rng: random.Random) -> float:
+    '''Returns a number in (0, 1], which is safe to take the log of.'''
+    return 1.0 - rng.random()
+
+
+class _Reservoir(ty.Generic[ElemType]):
+    '''
+    Keeps a uniform sample of k elements using Algorithm L (Li, 1994).
+    Once the reservoir is full, it draws how many elements to skip before the next replacement, so skipped elements cost no random numbers.
+    '''
+
+    def __init__(self, k: int, rng: random.Random):
+        self.items: list[ElemType] = []
+        self._k = k
+        self._rng = rng
+        self._weight = 1.0
+        self._skip = 0
+
+    def _draw_skip(self) -> None:
+        self._weight = self._weight * math.exp(math.log(_uniform(self._rng)) / self._k)
+        if self._weight >= 1.0:  # pragma: no cover
+            self._skip = 0
+            return
+        self._skip = math.floor(math.log(_uniform(self._rng)) / math.log1p(-self._weight))
+
+    def offer(self, elem: ElemType) -> None:
+        '''Offers one element, for sources that cannot skip ahead.'''
+        if len(self.items) < self._k:
+            self.items.append(elem)
+            if len(self.items) == self._k:
+                self._draw_skip()
+        elif self._skip > 0:
+            self._skip = self._skip - 1
+        else:
+            self.items[self._rng.randrange(self._k)] = elem
+            self._draw_skip()
+
+    def fill(self, it: ty.Iterator[ElemType]) -> None:
+        '''Offers every element of the iterator, jumping over skipped elements with islice.'''
+        for elem in itertools.islice(it, self._k - len(self.items)):
+            self.offer(elem)
+
+        if len(self.items) < self._k:
+            return
+
+        while True:
+            elem = next(itertools.islice(it, self._skip, None), _missing)
+            if elem is _missing:
+                return
+            self.items[self._rng.randrange(self._k)] = elem
+            self._draw_skip()
+
+
+def sample(it: ty.Iterable[ElemType], k: int, rng: Rng = None) -> list[ElemType]:
+    if k < 0:
+        raise ValueError(f'Cannot sample a negative number of elements: {k}')
+    if k == 0:
+        return []
+
+    reservoir: _Reservoir[ElemType] = _Reservoir(k, _make_rng(rng))
+    reservoir.fill(iter(it))
+    return reservoir.items
+
+
+def sample_by(
+        it: ty.Iterable[ElemType],
+        key: ty.Callable[[ElemType], KeyType],
+        k: int,
+        rng: Rng = None,
+    ) -> dict[KeyType, list[ElemType]]:
+    if k < 0:
+        raise ValueError(f'Cannot sample a negative number of elements: {k}')
+
+    shared_rng = _make_rng(rng)
+    strata: dict[KeyType, _Reservoir[ElemType]] = {}
+
+    for elem in it:
+        group = key(elem)
+        reservoir = strata.get(group)
+        if reservoir is None:
+            reservoir = strata[group] = _Reservoir(k, shared_rng)
+        if k > 0:
+            reservoir.offer(elem)
+
+    return {group: reservoir.items for group, reservoir in strata.items()}
+
+
+class _FractionSampleIterable(ty.Generic[ElemType]):
+    '''
+    Keeps each element with probability p. The gaps between kept elements are drawn from a geometric distribution
+    and jumped over with islice, so skipped elements cost no random numbers.
+    '''
+
+    def __init__(self, parent: ty.Iterable[ElemType], p: float, rng: Rng):
+        self._parent = parent
+        self._p = p
+        self._rng = rng
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        rng = _make_rng(self._rng)
+        it = iter(self._parent)
+        log_miss = math.log1p(-self._p)
+
+        while True:
+            skip = math.floor(math.log(_uniform(rng)) / log_miss)
+            elem = next(itertools.islice(it, skip, None), _missing)
+            if elem is _missing:
+                return
+            yield elem
+
+
+def sample_fraction(it: ty.Iterable[ElemType], p: float, rng: Rng = None) -> ty.Iterable[ElemType]:
+    if not 0 <= p <= 1:
+        raise ValueError(f'Fraction must be between 0 and 1: {p}')
+    if p == 0:
+        return ()
+    if p == 1:
+        return it
+    return _FractionSampleIterable(it, p, rng)
+
+
+__all__ = [
+    'sample',
+    'sample_by',
+    'sample_fraction',
+]
@@ -0,0 +1,387 @@
+import typing as ty
+
+import bisect
+import math
+import random
+
+
+Number = ty.Union[int, float]
+
+
+class Stats:
+    '''
+    Count, sum, min, max, mean and variance of numbers, gathered in one pass with Welford's method.
+    Stats of separate partitions can be combined with `merge`.
+    '''
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum: Number = 0
+        self.min: Number|None = None
+        self.max: Number|None = None
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, x: Number) -> None:
+        self.count = self.count + 1
+        self.sum = self.sum + x
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+        delta = x - self._mean
+        self._mean = self._mean + delta / self.count
+        self._m2 = self._m2 + delta * (x - self._mean)
+
+    def merge(self, other: 'Stats') -> 'Stats':
+        '''Returns the stats of both sets of numbers together (Chan et al.'s parallel variance).'''
+        ret = Stats()
+        ret.count = self.count + other.count
+        ret.sum = self.sum + other.sum
+        ret.min = min((x for x in (self.min, other.min) if x is not None), default=None)
+        ret.max = max((x for x in (self.max, other.max) if x is not None), default=None)
+
+        if ret.count > 0:
+            delta = other._mean - self._mean
+            ret._mean = self._mean + delta * other.count / ret.count
+            ret._m2 = self._m2 + other._m2 + delta * delta * self.count * other.count / ret.count
+
+        return ret
+
+    @property
+    def mean(self) -> float:
+        if self.count < 1:
+            raise ValueError('Mean requires at least one number')
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        '''The sample variance, like statistics.variance.'''
+        if self.count < 2:
+            raise ValueError('Variance requires at least two numbers')
+        return self._m2 / (self.count - 1)
+
+    @property
+    def pvariance(self) -> float:
+        '''The population variance, like statistics.pvariance.'''
+        if self.count < 1:
+            raise ValueError('Population variance requires at least one number')
+        return self._m2 / self.count
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def __repr__(self) -> str:
+        if self.count < 1:
+            return 'Stats(count=0)'
+        return f'Stats(count={self.count}, sum={self.sum}, min={self.min}, max={self.max}, mean={self._mean})'
+
+
+class QuantileSketch:
+    '''Base class for summaries of numbers that estimate quantiles in bounded memory, and that can be merged.'''
+
+    # Required methods (must override in subclass)
+
+    def add(self, x: Number) -> None:  # pragma: no cover
+        raise NotImplementedError()
+
+    def merge(self, other: ty.Any) -> ty.Any:  # pragma: no cover
+        '''Returns a sketch of both sets of numbers together. Neither sketch is changed.'''
+        raise NotImplementedError()
+
+    def quantile(self, q: float) -> float:  # pragma: no cover
+        raise NotImplementedError()
+
+    def __len__(self) -> int:  # pragma: no cover
+        '''Returns how many numbers were added.'''
+        raise NotImplementedError()
+
+
+    # Provided methods
+
+    def quantiles(self, qs: ty.Iterable[float]) -> list[float]:
+        return [self.quantile(q) for q in qs]
+
+
+class TDigest(QuantileSketch):
+    '''
+    A merging t-digest (Dunning). Keeps clusters of nearby numbers, with small clusters near the tails so that extreme quantiles stay accurate.
+    Holds about `compression` clusters.
+    '''
+
+    def __init__(self, compression: int = 100):
+        if compression < 10:
+            raise ValueError(f'Compression must be at least 10: {compression}')
+
+        self._compression = compression
+        self._means: list[float] = []
+        self._weights: list[float] = []
+        self._buffer: list[tuple[float, float]] = []
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, x: Number) -> None:
+        self._buffer.append((x, 1))
+        self._count = self._count + 1
+        if x < self._min:
+            self._min = x
+        if x > self._max:
+            self._max = x
+        if len(self._buffer) >= self._compression * 5:
+            self._compress()
+
+    def _scale(self, q: float) -> float:
+        # The k1 scale function: clusters may span at most 1 unit of k
+        return self._compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+
+        points = sorted(list(zip(self._means, self._weights)) + self._buffer)
+        self._buffer = []
+        total = sum(weight for _, weight in points)
+
+        means: list[float] = []
+        weights: list[float] = []
+
+        mean, weight = points[0]
+        before = 0.0
+        k_low = self._scale(0)
+        for x, w in points[1:]:
+            if self._scale(min(1.0, (before + weight + w) / total)) - k_low <= 1:
+                weight = weight + w
+                mean = mean + (x - mean) * w / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                before = before + weight
+                k_low = self._scale(before / total)
+                mean, weight = x, w
+        means.append(mean)
+        weights.append(weight)
+
+        self._means = means
+        self._weights = weights
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        ret = TDigest(max(self._compression, other._compression))
+        for digest in (self, other):
+            ret._buffer.extend(zip(digest._means, digest._weights))
+            ret._buffer.extend(digest._buffer)
+        ret._count = self._count + other._count
+        ret._min = min(self._min, other._min)
+        ret._max = max(self._max, other._max)
+        ret._compress()
+        return ret
+
+    def quantile(self, q: float) -> float:
+        _check_quantile(q)
+        self._compress()
+        if not self._means:
+            raise ValueError('Quantiles require at least one number')
+
+        means = self._means
+        weights = self._weights
+        total = sum(weights)
+        target = q * total
+
+        if len(means) == 1 or target <= weights[0] / 2:
+            if len(means) == 1 or weights[0] <= 1:
+                return self._min if q == 0 else means[0]
+            return self._min + (means[0] - self._min) * target / (weights[0] / 2)
+
+        if target >= total - weights[-1] / 2:
+            if weights[-1] <= 1:
+                return self._max if q == 1 else means[-1]
+            return self._max - (self._max - means[-1]) * (total - target) / (weights[-1] / 2)
+
+        # Interpolate between the centers of the two clusters around the target
+        center = weights[0] / 2
+        for i in range(len(means) - 1):
+            next_center = center + (weights[i] + weights[i + 1]) / 2
+            if target <= next_center:
+                return means[i] + (means[i + 1] - means[i]) * (target - center) / (next_center - center)
+            center = next_center
+
+        return means[-1]  # pragma: no cover
+
+
+class KLLSketch(QuantileSketch):
+    '''
+    A KLL sketch (Karnin, Lang and Liberty). Keeps a stack of sorted buffers, where higher levels stand for more numbers each.
+    Holds about 3k numbers, and a quantile's rank is off by about 1.7/k of the count.
+    Pass a seeded `random.Random` as rng to get reproducible results.
+    '''
+
+    def __init__(self, k: int = 200, rng: random.Random|None = None):
+        if k < 8:
+            raise ValueError(f'k must be at least 8: {k}')
+
+        self._k = k
+        self._rng = rng if rng is not None else random.Random()
+        self._levels: list[list[Number]] = []
+        self._size = 0
+        self._max_size = 0
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+        self._grow()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return int(math.ceil((2 / 3) ** depth * self._k)) + 1
+
+    def _grow(self) -> None:
+        self._levels.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def add(self, x: Number) -> None:
+        self._levels[0].append(x)
+        self._size = self._size + 1
+        self._count = self._count + 1
+        if x < self._min:
+            self._min = x
+        if x > self._max:
+            self._max = x
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        while self._size >= self._max_size:
+            for level, items in enumerate(self._levels):
+                if len(items) >= self._capacity(level):
+                    if level + 1 >= len(self._levels):
+                        self._grow()
+
+                    # Keep every other number, starting at random, and promote them to stand for twice as many
+                    items.sort()
+                    leftover = items.pop() if len(items) % 2 else None
+                    self._levels[level + 1].extend(items[self._rng.randrange(2)::2])
+                    items.clear()
+                    if leftover is not None:
+                        items.append(leftover)
+
+                    self._size = sum(len(items) for items in self._levels)
+                    break
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        ret = KLLSketch(max(self._k, other._k), self._rng)
+        while len(ret._levels) < max(len(self._levels), len(other._levels)):
+            ret._grow()
+        for sketch in (self, other):
+            for level, items in enumerate(sketch._levels):
+                ret._levels[level].extend(items)
+        ret._size = sum(len(items) for items in ret._levels)
+        ret._count = self._count + other._count
+        ret._min = min(self._min, other._min)
+        ret._max = max(self._max, other._max)
+        ret._compress()
+        return ret
+
+    def quantile(self, q: float) -> float:
+        _check_quantile(q)
+        if self._count < 1:
+            raise ValueError('Quantiles require at least one number')
+        if q == 0:
+            return self._min
+        if q == 1:
+            return self._max
+
+        weighted = sorted(
+            (x, 2 ** level)
+            for level, items in enumerate(self._levels)
+            for x in items
+        )
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+
+        seen = 0
+        for x, weight in weighted:
+            seen = seen + weight
+            if seen >= target:
+                return x
+        return weighted[-1][0]  # pragma: no cover
+
+
+def _check_quantile(q: float) -> None:
+    if not 0 <= q <= 1:
+        raise ValueError(f'Quantiles must be between 0 and 1: {q}')
+
+
+def exact_quantiles(data: list[Number], qs: ty.Iterable[float]) -> list[float]:
+    '''Sorts the data in place, then interpolates between the closest ranks (like numpy's default method).'''
+    data.sort()
+    ret = []
+    for q in qs:
+        _check_quantile(q)
+        position = (len(data) - 1) * q
+        low = math.floor(position)
+        high = min(low + 1, len(data) - 1)
+        ret.append(data[low] + (data[high] - data[low]) * (position - low))
+    return ret
+
+
+def sketch(method: str, **options: ty.Any) -> QuantileSketch:
+    if method == 'tdigest':
+        return TDigest(**options)
+    if method == 'kll':
+        return KLLSketch(**options)
+    raise ValueError(f'Unknown quantile method: {method!r}')
+
+
+def histogram(
+        it: ty.Iterable[Number],
+        bins: int|ty.Sequence[Number],
+        range: tuple[Number, Number]|None = None,
+    ) -> tuple[list[int], list[float]]:
+    '''
+    Counts numbers into bins, like numpy.histogram. Returns the counts and the bin edges.
+    Every bin includes its left edge. The last bin also includes its right edge.
+    '''
+
+    if isinstance(bins, int):
+        if bins < 1:
+            raise ValueError(f'Need at least one bin: {bins}')
+        if range is None:
+            raise ValueError('A range is needed to split into equal bins')
+        low, high = range
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        edges = [low + (high - low) * i / bins for i in _range(bins + 1)]
+    else:
+        edges = list(bins)
+        if len(edges) < 2 or any(a > b for a, b in zip(edges, edges[1:])):
+            raise ValueError('Bin edges must be increasing, with at least two of them')
+
+    counts = [0] * (len(edges) - 1)
+    first = edges[0]
+    last = edges[-1]
+    for x in it:
+        if x < first or x > last:
+            continue
+        index = bisect.bisect_right(edges, x) - 1
+        counts[min(index, len(counts) - 1)] += 1
+
+    return counts, edges
+
+
+# histogram's range parameter shadows the builtin, like numpy's
+_range = range
+
+
+__all__ = [
+    'Stats',
+    'QuantileSketch',
+    'TDigest',
+    'KLLSketch',
+]
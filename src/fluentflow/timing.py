@@ -0,0 +1,144 @@
+import typing as ty
+
+import time
+
+
+ElemType = ty.TypeVar('ElemType')
+
+
+Clock = ty.Callable[[], float]
+Sleep = ty.Callable[[float], None]
+
+
+class _ThrottleIterator(ty.Generic[ElemType]):
+    '''
+    Decorates an iterator with a token bucket.
+    The bucket holds up to `burst` tokens and refills at `rate / per` tokens per second. Each element takes one token.
+    '''
+
+    def __init__(
+            self,
+            parent: ty.Iterator[ElemType],
+            rate: float,
+            per: float,
+            burst: int,
+            clock: Clock,
+            sleep: Sleep,
+        ):
+        self._parent = parent
+        self._fill_rate = rate / per
+        self._capacity = burst
+        self._clock = clock
+        self._sleep = sleep
+
+        self._tokens = float(burst)
+        self._last: float|None = None
+
+    def __iter__(self) -> ty.Self:  # pragma: no cover
+        return self
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self._last is not None:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._fill_rate)
+        self._last = now
+
+    def __next__(self) -> ElemType:
+        ret = next(self._parent)
+
+        self._refill()
+        if self._tokens < 1:
+            self._sleep((1 - self._tokens) / self._fill_rate)
+            self._refill()
+            # Sleeping the whole deficit earns the token, even if rounding leaves the refill a hair short
+            self._tokens = max(self._tokens, 1.0)
+
+        self._tokens = self._tokens - 1
+        return ret
+
+
+class _ThrottleIterable(ty.Generic[ElemType]):
+
+    def __init__(
+            self,
+            parent: ty.Iterable[ElemType],
+            rate: float,
+            per: float,
+            burst: int,
+            clock: Clock,
+            sleep: Sleep,
+        ):
+        self._parent = parent
+        self._args = (rate, per, burst, clock, sleep)
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        return _ThrottleIterator(iter(self._parent), *self._args)
+
+
+class _DebounceIterable(ty.Generic[ElemType]):
+
+    def __init__(self, parent: ty.Iterable[ElemType], wait: float, clock: Clock):
+        self._parent = parent
+        self._wait = wait
+        self._clock = clock
+
+    def __next__(self) -> ty.Any:  # pragma: no cover
+        raise TypeError('Call __iter__ first')
+
+    def __iter__(self) -> ty.Iterator[ElemType]:
+        it = iter(self._parent)
+
+        for pending in it:
+            pending_time = self._clock()
+            break
+        else:
+            return
+
+        for elem in it:
+            now = self._clock()
+            if now - pending_time >= self._wait:
+                yield pending
+            pending = elem
+            pending_time = now
+
+        yield pending
+
+
+def throttle(
+        it: ty.Iterable[ElemType],
+        rate: float,
+        per: float = 1.0,
+        burst: int = 1,
+        clock: Clock|None = None,
+        sleep: Sleep|None = None,
+    ) -> ty.Iterable[ElemType]:
+
+    if rate <= 0:
+        raise ValueError(f'Rate must be positive: {rate}')
+    if per <= 0:
+        raise ValueError(f'Period must be positive: {per}')
+    if burst < 1:
+        raise ValueError(f'Burst must be at least 1: {burst}')
+
+    return _ThrottleIterable(it, rate, per, burst, clock or time.monotonic, sleep or time.sleep)
+
+
+def debounce(
+        it: ty.Iterable[ElemType],
+        wait: float,
+        clock: Clock|None = None,
+    ) -> ty.Iterable[ElemType]:
+
+    if wait < 0:
+        raise ValueError(f'Cannot wait a negative time: {wait}')
+
+    return _DebounceIterable(it, wait, clock or time.monotonic)
+
+
+__all__ = [
+    'throttle',
+    'debounce',
+]
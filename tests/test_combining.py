@@ -0,0 +1,89 @@
+import collections.abc
+import unittest
+
+from fluentflow import Flows
+
+
+def _get_data():
+    for x in range(5):
+        yield x
+
+
+class TestZip(unittest.TestCase):
+
+    def test_zip_lists(self):
+        self.assertEqual([(1, 'a'), (2, 'b')], Flows.of(1, 2, 3).zip(['a', 'b']).to_list())
+
+    def test_zip_generator(self):
+        self.assertEqual([(0, 0), (1, 2)], Flows.calling(_get_data).zip(range(0, 4, 2)).to_list())
+
+    def test_zip_random_access(self):
+        flow = Flows.create(range(10)).zip(range(100, 105))
+        self.assertEqual(5, flow.count())
+        self.assertEqual((4, 104), flow.last())
+        self.assertEqual((2, 102), flow.get(2))
+        self.assertEqual(5, len(flow.to_list()))
+
+    def test_zip_nothing(self):
+        self.assertEqual([], Flows.zip().to_list())
+
+
+class TestConcat(unittest.TestCase):
+
+    def test_concat_generators(self):
+        self.assertEqual([0, 1, 2, 3, 4, 0, 1, 2, 3, 4], Flows.calling(_get_data).concat(Flows.calling(_get_data)).to_list())
+
+    def test_concat_random_access(self):
+        flow = Flows.create([1, 2]).concat([], (3,), range(4, 6))
+        self.assertEqual([1, 2, 3, 4, 5], flow.to_list())
+        self.assertEqual(5, flow.count())
+        self.assertEqual(3, flow.get(2))
+        self.assertEqual(5, flow.last())
+        self.assertRaises(IndexError, lambda: flow.get(5))
+
+    def test_concat_is_lazy(self):
+        data = [1, 2]
+        flow = Flows.create(data).concat([3])
+        data.append(10)
+        self.assertEqual([1, 2, 10, 3], flow.to_list())
+        self.assertEqual(4, flow.count())
+
+
+class TestInterleave(unittest.TestCase):
+
+    def test_interleave_generators(self):
+        self.assertEqual(
+            [0, 'a', 1, 'b', 2, 3, 4],
+            Flows.interleave(Flows.calling(_get_data), iter('ab')).to_list()
+        )
+
+    def test_interleave_random_access(self):
+        flow = Flows.interleave([1, 2, 3], 'ab', [], range(10, 14))
+        expected = [1, 'a', 10, 2, 'b', 11, 3, 12, 13]
+        self.assertEqual(expected, flow.to_list())
+        self.assertEqual(len(expected), flow.count())
+        self.assertEqual(expected, [flow.get(i) for i in range(len(expected))])
+        self.assertEqual(13, flow.last())
+
+
+class TestMergeSorted(unittest.TestCase):
+
+    def test_merge_sorted(self):
+        flow = Flows.merge_sorted([1, 4, 7], Flows.calling(_get_data), range(3, 9, 3))
+        self.assertEqual([0, 1, 1, 2, 3, 3, 4, 4, 6, 7], flow.to_list())
+
+    def test_merge_sorted_key(self):
+        flow = Flows.merge_sorted(['a', 'ccc'], ['bb', 'dddd'], key=len)
+        self.assertEqual(['a', 'bb', 'ccc', 'dddd'], flow.to_list())
+
+    def test_merge_sorted_known_length(self):
+        flow = Flows.merge_sorted([1, 4, 7], range(3))
+        self.assertEqual(6, flow.count())
+        self.assertEqual(7, flow.last())
+
+    def test_merge_sorted_get_walks(self):
+        flow = Flows.merge_sorted([1, 4, 7], range(3))
+        self.assertNotIsInstance(flow._data, collections.abc.Sequence)
+        self.assertEqual(2, flow.get(3))
+        self.assertEqual(4, flow.get(-2))
+        self.assertEqual([1, 2, 4], flow.skip(2).limit(3).to_list())
@@ -41,3 +41,25 @@ class TestFlowConcurrentModification(unittest.TestCase):
         data.remove(3)
         self.assertFalse(stream.contains(3))
 
+
+    def test_concurrent_index_length_change(self):
+
+        data = list(range(10))
+        index = Flows.create(data).index_by(lambda a: a % 3)
+        self.assertEqual(4, len(index.get_by_key(0)))
+
+        data.extend(range(10))
+        self.assertEqual(8, len(index.get_by_key(0)))
+
+    def test_concurrent_lookup_invalidate(self):
+
+        data = list(range(10))
+        lookup = Flows.create(data).to_lookup()
+        self.assertTrue(lookup.contains(3))
+
+        data[3] = 100
+        self.assertTrue(lookup.contains(3))
+
+        lookup.invalidate()
+        self.assertFalse(lookup.contains(3))
+        self.assertTrue(lookup.contains(100))
@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import fluentflow
+
+
+# The most time, in milliseconds, that `import fluentflow` may take once typing, itertools and collections.abc are loaded.
+# It is generous so that slow machines pass. Set FLUENTFLOW_IMPORT_BUDGET_MS to tighten or loosen it.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get('FLUENTFLOW_IMPORT_BUDGET_MS', '250'))
+
+# The only modules that `import fluentflow` may load
+ALLOWED_MODULES = {
+    'fluentflow',
+    'fluentflow.flows',
+    'fluentflow.iterables',
+    'fluentflow.memory',
+}
+
+_PRELUDE = 'import sys, typing, itertools, collections.abc'
+
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(fluentflow.__file__)))
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (_PACKAGE_ROOT, env.get('PYTHONPATH'))))
+    return subprocess.run((sys.executable, *args), env=env, capture_output=True, text=True, check=True)
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_only_core_modules_are_imported(self):
+        result = _run_python('-c', '\n'.join((
+            _PRELUDE,
+            'before = set(sys.modules)',
+            'import fluentflow',
+            'print(*sorted(set(sys.modules) - before))',
+        )))
+        self.assertLessEqual(set(result.stdout.split()), ALLOWED_MODULES)
+
+    def test_optional_subsystems_load_on_first_use(self):
+        result = _run_python('-c', '\n'.join((
+            _PRELUDE,
+            'import fluentflow',
+            'print("fluentflow.checkpoints" in sys.modules)',
+            'fluentflow.FileCheckpointStore',
+            'print("fluentflow.checkpoints" in sys.modules)',
+        )))
+        self.assertEqual(['False', 'True'], result.stdout.split())
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, lambda: fluentflow.NotAThing)
+
+    def test_import_time_budget(self):
+        result = _run_python('-X', 'importtime', '-c', _PRELUDE + '; import fluentflow')
+
+        # Lines look like `import time: self [us] | cumulative | name`
+        lines = [line.split('|') for line in result.stderr.splitlines() if line.startswith('import time:')]
+        cumulative = [int(fields[1]) for fields in lines if fields[2].strip() == 'fluentflow']
+
+        self.assertEqual(1, len(cumulative))
+        self.assertLess(cumulative[0] / 1000, IMPORT_TIME_BUDGET_MS)
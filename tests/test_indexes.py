@@ -0,0 +1,63 @@
+import unittest
+
+from fluentflow import Flows
+
+
+_PEOPLE = [
+    {'Name': 'Ada', 'Age': 36},
+    {'Name': 'Brian', 'Age': 27},
+    {'Name': 'Cleo', 'Age': 36},
+    {'Name': 'Dan', 'Age': 51},
+]
+
+
+class TestContains(unittest.TestCase):
+
+    def test_contains_on_map(self):
+        flow = Flows.create(range(10)).map(lambda a: a * 2)
+        self.assertTrue(flow.contains(4))
+        self.assertFalse(flow.contains(5))
+
+    def test_contains_empty(self):
+        self.assertFalse(Flows.empty().contains(1))
+
+
+class TestIndexBy(unittest.TestCase):
+
+    def test_get_by_key(self):
+        index = Flows.create(_PEOPLE).index_by(lambda p: p['Age'])
+        self.assertEqual(('Ada', 'Cleo'), tuple(p['Name'] for p in index.get_by_key(36)))
+        self.assertEqual((), index.get_by_key(99))
+        self.assertEqual(3, len(index))
+
+    def test_contains_key(self):
+        index = Flows.create(_PEOPLE).index_by(lambda p: p['Name'])
+        self.assertTrue(index.contains_key('Dan'))
+        self.assertFalse(index.contains_key('Eve'))
+
+    def test_contains_uses_group(self):
+        index = Flows.create(_PEOPLE).index_by(lambda p: p['Age'])
+        self.assertTrue(index.contains({'Name': 'Cleo', 'Age': 36}))
+        self.assertFalse(index.contains({'Name': 'Eve', 'Age': 36}))
+
+    def test_range(self):
+        index = Flows.create(_PEOPLE).index_by(lambda p: p['Age'])
+        self.assertEqual(['Ada', 'Cleo', 'Dan'], [p['Name'] for p in index.range(30)])
+        self.assertEqual(['Brian', 'Ada', 'Cleo'], [p['Name'] for p in index.range(high=51)])
+        self.assertEqual([], index.range(40, 50))
+
+    def test_built_once(self):
+        calls = []
+        flow = Flows.create(range(5)).map(lambda a: calls.append(a) or a)
+        index = flow.to_lookup()
+        for x in range(10):
+            index.contains(x)
+        self.assertEqual(5, len(calls))
+
+
+class TestToLookup(unittest.TestCase):
+
+    def test_contains(self):
+        lookup = Flows.calling(lambda: (x * x for x in range(10))).to_lookup()
+        self.assertTrue(lookup.contains(81))
+        self.assertFalse(lookup.contains(80))
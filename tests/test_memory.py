@@ -0,0 +1,86 @@
+import unittest
+
+from fluentflow import Flows, MemoryLimitError
+
+
+def _get_data():
+    for x in range(1000):
+        yield x
+
+
+class _MemoryLimitTestCase(unittest.TestCase):
+
+    def setUp(self):
+        Flows.reset_memory_usage()
+
+    def tearDown(self):
+        Flows.configure(memory_limit=None, spill_to_disk=False, spill_directory=None, track_memory=False)
+        Flows.reset_memory_usage()
+
+
+class TestMemoryLimit(_MemoryLimitTestCase):
+
+    def test_no_limit(self):
+        self.assertEqual(999, Flows.calling(_get_data).reverse().first())
+        self.assertEqual({}, Flows.memory_usage())
+
+    def test_reverse_over_limit(self):
+        Flows.configure(memory_limit=1000)
+        self.assertRaises(MemoryLimitError, lambda: Flows.calling(_get_data).reverse().first())
+
+    def test_reverse_within_limit(self):
+        Flows.configure(memory_limit=1_000_000)
+        self.assertEqual(999, Flows.calling(_get_data).reverse().first())
+
+    def test_reverse_spills_to_disk(self):
+        Flows.configure(memory_limit=1000, spill_to_disk=True)
+        result = []
+        Flows.calling(_get_data).reverse().for_each(result.append)
+        self.assertEqual(list(range(999, -1, -1)), result)
+        self.assertEqual(list(range(999, 979, -1)), Flows.calling(_get_data).reverse().limit(20).to_list())
+
+    def test_reverse_cannot_spill_unpicklable(self):
+        Flows.configure(memory_limit=1000, spill_to_disk=True)
+        flow = Flows.calling(lambda: (lambda: x for x in range(1000)))
+        self.assertRaises(MemoryLimitError, lambda: flow.reverse().first())
+
+    def test_distinct_over_limit(self):
+        Flows.configure(memory_limit=1000, spill_to_disk=True)
+        self.assertRaises(MemoryLimitError, lambda: Flows.calling(_get_data).distinct().count())
+
+    def test_distinct_duplicates_not_counted(self):
+        Flows.configure(memory_limit=1000)
+        self.assertEqual(1, Flows.calling(lambda: [1] * 1000).distinct().count())
+
+    def test_collectors_over_limit(self):
+        Flows.configure(memory_limit=1000)
+        flow = Flows.calling(_get_data)
+        self.assertRaises(MemoryLimitError, flow.to_list)
+        self.assertRaises(MemoryLimitError, flow.to_tuple)
+        self.assertRaises(MemoryLimitError, flow.to_set)
+
+    def test_get_negative_index(self):
+        Flows.configure(memory_limit=1000)
+        self.assertEqual(999, Flows.calling(_get_data).last())
+        self.assertEqual(990, Flows.calling(_get_data).get(-10))
+        self.assertRaises(MemoryLimitError, lambda: Flows.calling(_get_data).get(-500))
+
+    def test_negative_limit(self):
+        self.assertRaises(ValueError, lambda: Flows.configure(memory_limit=-1))
+
+
+class TestMemoryUsage(_MemoryLimitTestCase):
+
+    def test_peak_usage_per_operator(self):
+        Flows.configure(track_memory=True)
+        Flows.calling(_get_data).to_list()
+        Flows.calling(_get_data).limit(10).to_list()
+        Flows.calling(_get_data).reverse().first()
+
+        usage = Flows.memory_usage()
+        self.assertEqual({'to_list', 'reverse'}, set(usage))
+        self.assertGreater(usage['to_list'], 1000 * 8)
+
+    def test_get_negative_index_past_start(self):
+        self.assertRaises(IndexError, lambda: Flows.calling(_get_data).get(-1001))
+        self.assertEqual(0, Flows.calling(_get_data).get(-1000))
@@ -0,0 +1,83 @@
+import threading
+import unittest
+
+from fluentflow import Flows
+
+
+class TestParallelFlatMap(unittest.TestCase):
+
+    def test_ordered(self):
+        flow = Flows.create(range(20)).parallel_flatmap(lambda a: [a] * (a % 4), workers=4)
+        self.assertEqual(Flows.create(range(20)).flatmap(lambda a: [a] * (a % 4)).to_list(), flow.to_list())
+
+    def test_unordered(self):
+        flow = Flows.create(range(20)).parallel_flatmap(lambda a: [a] * (a % 4), workers=4, ordered=False)
+        self.assertEqual(sorted(Flows.create(range(20)).flatmap(lambda a: [a] * (a % 4)).to_list()), sorted(flow.to_list()))
+
+    def test_expansions_overlap(self):
+        # Every call waits until all four are running at once, which only works if they run concurrently
+        barrier = threading.Barrier(4, timeout=5)
+
+        def _expand(a):
+            barrier.wait()
+            return (a, a)
+
+        for ordered in (True, False):
+            barrier.reset()
+            flow = Flows.create(range(4)).parallel_flatmap(_expand, workers=4, ordered=ordered)
+            self.assertEqual([0, 0, 1, 1, 2, 2, 3, 3], sorted(flow.to_list()))
+
+    def test_ordered_streams_head_before_it_finishes(self):
+        first_taken = threading.Event()
+
+        def _expand(a):
+            yield a
+            if a == 0:
+                # The consumer has to see element 0 while this expansion is still going
+                self.assertTrue(first_taken.wait(5))
+            yield a
+
+        it = iter(Flows.create(range(3)).parallel_flatmap(_expand, workers=2))
+        self.assertEqual(0, next(it))
+        first_taken.set()
+        self.assertEqual([0, 1, 1, 2, 2], list(it))
+
+    def test_buffer_cap(self):
+        produced = []
+        capped = threading.Event()
+
+        def _expand(a):
+            for x in range(1000):
+                produced.append(x)
+                if len(produced) == 5:
+                    capped.set()
+                yield x
+
+        # With one worker and max_buffered=3: one element taken, three buffered, one waiting to go in
+        it = iter(Flows.of('a').parallel_flatmap(_expand, workers=1, max_buffered=3))
+        self.assertEqual(0, next(it))
+        self.assertTrue(capped.wait(5))
+        self.assertEqual(5, len(produced))
+        self.assertEqual(999, sum(1 for _ in it))
+
+    def test_errors_propagate(self):
+        def _expand(a):
+            if a == 3:
+                raise KeyError(a)
+            return [a]
+
+        for ordered in (True, False):
+            flow = Flows.create(range(10)).parallel_flatmap(_expand, workers=3, ordered=ordered)
+            self.assertRaises(KeyError, flow.to_list)
+
+    def test_stops_early(self):
+        self.assertEqual([0, 1, 2], Flows.create(range(10)).parallel_flatmap(lambda a: range(1000), workers=2).limit(3).to_list())
+
+    def test_empty(self):
+        self.assertEqual([], Flows.empty().parallel_flatmap(lambda a: [a], workers=2).to_list())
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, lambda: Flows.empty().parallel_flatmap(lambda a: [a], workers=0))
+        self.assertRaises(ValueError, lambda: Flows.empty().parallel_flatmap(lambda a: [a], workers=1, max_buffered=0))
+        self.assertRaises(ValueError, lambda: Flows.empty().parallel_flatmap(lambda a: [a], workers=4, max_buffered=3))
+        self.assertRaises(ValueError, lambda: Flows.empty().parallel_flatmap(lambda a: [a], workers=4, ordered=False, max_buffered=3))
@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+
+from fluentflow import Flows, EmptyFlowError, MemoryCheckpointStore, FileCheckpointStore
+
+
+class TestResumableFlow(unittest.TestCase):
+
+    def test_count_only_processes_new_elements(self):
+        data = list(range(10))
+        seen = []
+        store = MemoryCheckpointStore()
+        stream = Flows.resumable(data, store).map(lambda a: seen.append(a) or a)
+
+        self.assertEqual(10, stream.count())
+        self.assertEqual(10, len(seen))
+
+        data.extend(range(5))
+        self.assertEqual(15, stream.count())
+        self.assertEqual(15, len(seen))
+
+    def test_reduce_merges_into_saved_result(self):
+        data = [1, 2, 3]
+        store = MemoryCheckpointStore()
+        stream = Flows.resumable(data, store)
+
+        self.assertEqual(6, stream.reduce(lambda a, b: a+b))
+        data.extend([4, 5])
+        self.assertEqual(15, stream.reduce(lambda a, b: a+b))
+        self.assertEqual(15, stream.reduce(lambda a, b: a+b))
+
+    def test_filter_offset_counts_source_elements(self):
+        data = list(range(10))
+        store = MemoryCheckpointStore()
+        stream = Flows.resumable(data, store).filter(lambda a: a % 2 == 0)
+
+        self.assertEqual(5, stream.count())
+        data.extend(range(10, 20))
+        self.assertEqual(10, stream.count())
+
+    def test_iteration_yields_new_elements(self):
+        data = list(range(3))
+        store = MemoryCheckpointStore()
+        stream = Flows.resumable(data, store)
+
+        self.assertEqual([0, 1, 2], stream.to_list())
+        stream.count()
+        data.extend([3, 4])
+        self.assertEqual([3, 4], stream.to_list())
+
+    def test_sequence_rerun_reads_only_new_elements(self):
+        read = []
+
+        class _WatchedList(list):
+            def __getitem__(self, index):
+                read.extend(range(len(self))[index] if isinstance(index, slice) else [index])
+                return super().__getitem__(index)
+
+        data = _WatchedList(range(5))
+        store = MemoryCheckpointStore()
+        self.assertEqual(5, Flows.resumable(Flows.create(data), store).count())
+
+        read.clear()
+        self.assertEqual(5, Flows.resumable(Flows.create(data), store).count())
+        self.assertEqual([], read)
+
+        data.append(5)
+        self.assertEqual(6, Flows.resumable(Flows.create(data), store).count())
+        self.assertEqual([5], read)
+
+    def test_reset(self):
+        data = list(range(3))
+        stream = Flows.resumable(data, MemoryCheckpointStore())
+        self.assertEqual(3, stream.count())
+        stream.reset()
+        self.assertEqual(3, stream.count())
+
+    def test_reduce_empty_error(self):
+        stream = Flows.resumable([], MemoryCheckpointStore())
+        self.assertRaises(EmptyFlowError, lambda: stream.reduce(lambda a, b: a+b))
+
+    def test_operation_mismatch(self):
+        store = MemoryCheckpointStore()
+        Flows.resumable([1, 2], store).count()
+        self.assertRaises(ValueError, lambda: Flows.resumable([1, 2], store).reduce(lambda a, b: a+b))
+
+
+class TestFileCheckpointStore(unittest.TestCase):
+
+    def test_rerun_with_new_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            data = list(range(10))
+            self.assertEqual(45, Flows.resumable(data, FileCheckpointStore(directory), 'sum').reduce(lambda a, b: a+b, 0))
+
+            data.append(10)
+            self.assertEqual(55, Flows.resumable(data, FileCheckpointStore(directory), 'sum').reduce(lambda a, b: a+b, 0))
+
+    def test_no_temporary_files_left(self):
+        with tempfile.TemporaryDirectory() as directory:
+            Flows.resumable(range(10), FileCheckpointStore(directory), 'count').count()
+            self.assertEqual(['count.checkpoint'], os.listdir(directory))
+
+    def test_failed_write_keeps_old_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileCheckpointStore(directory)
+            Flows.resumable([1, 2], store, 'reduce').reduce(lambda a, b: a+b)
+
+            unpicklable = lambda: None
+            data = [1, 2, unpicklable]
+            self.assertRaises(Exception, lambda: Flows.resumable(data, store, 'reduce').reduce(lambda a, b: b))
+
+            self.assertEqual(['reduce.checkpoint'], os.listdir(directory))
+            self.assertEqual(3, store.load('reduce').state)
+
+    def test_invalid_key(self):
+        store = FileCheckpointStore('.')
+        self.assertRaises(ValueError, lambda: store.load(os.path.join('a', 'b')))
@@ -0,0 +1,84 @@
+import random
+import unittest
+
+from fluentflow import Flows
+
+
+class TestSample(unittest.TestCase):
+
+    def test_sample_size(self):
+        result = Flows.create(range(1000)).sample(10, rng=1)
+        self.assertEqual(10, len(result))
+        self.assertEqual(10, len(set(result)))
+        self.assertTrue(all(0 <= x < 1000 for x in result))
+
+    def test_sample_shorter_flow(self):
+        self.assertEqual([0, 1, 2], Flows.create(range(3)).sample(10))
+
+    def test_sample_zero(self):
+        self.assertEqual([], Flows.create(range(3)).sample(0))
+
+    def test_sample_seeded(self):
+        flow = Flows.calling(lambda: iter(range(10000)))
+        self.assertEqual(flow.sample(5, rng=42), flow.sample(5, rng=42))
+        self.assertEqual(flow.sample(5, rng=random.Random(3)), flow.sample(5, rng=random.Random(3)))
+
+    def test_sample_is_uniform(self):
+        rng = random.Random(0)
+        hits = [0] * 10
+        for _ in range(2000):
+            for x in Flows.create(range(10)).sample(3, rng=rng):
+                hits[x] += 1
+        # Each element is picked 600 times on average
+        for count in hits:
+            self.assertAlmostEqual(600, count, delta=90)
+
+    def test_sample_skips_without_random_numbers(self):
+        class _CountingRandom(random.Random):
+            calls = 0
+            def random(self):
+                _CountingRandom.calls += 1
+                return super().random()
+
+        Flows.create(range(100000)).sample(10, rng=_CountingRandom(1))
+        self.assertLess(_CountingRandom.calls, 1000)
+
+    def test_sample_negative(self):
+        self.assertRaises(ValueError, lambda: Flows.empty().sample(-1))
+
+
+class TestSampleFraction(unittest.TestCase):
+
+    def test_fraction(self):
+        result = Flows.create(range(100000)).sample_fraction(0.1, rng=5).to_list()
+        self.assertAlmostEqual(10000, len(result), delta=500)
+        self.assertEqual(sorted(result), result)
+
+    def test_seed_repeats(self):
+        flow = Flows.create(range(1000)).sample_fraction(0.2, rng=9)
+        self.assertEqual(flow.to_list(), flow.to_list())
+
+    def test_edges(self):
+        self.assertEqual([], Flows.create(range(10)).sample_fraction(0).to_list())
+        self.assertEqual(list(range(10)), Flows.create(range(10)).sample_fraction(1).to_list())
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, lambda: Flows.empty().sample_fraction(1.5))
+
+
+class TestSampleBy(unittest.TestCase):
+
+    def test_stratified(self):
+        result = Flows.create(range(1000)).sample_by(lambda a: a % 3, 5, rng=2)
+        self.assertEqual({0, 1, 2}, set(result))
+        for key, elems in result.items():
+            self.assertEqual(5, len(elems))
+            self.assertTrue(all(x % 3 == key for x in elems))
+
+    def test_small_strata(self):
+        result = Flows.of('a', 'bb', 'cc', 'ddd').sample_by(len, 5)
+        self.assertEqual({1: ['a'], 2: ['bb', 'cc'], 3: ['ddd']}, result)
+
+    def test_seeded(self):
+        flow = Flows.create(range(1000))
+        self.assertEqual(flow.sample_by(lambda a: a % 2, 3, rng=4), flow.sample_by(lambda a: a % 2, 3, rng=4))
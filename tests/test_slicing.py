@@ -0,0 +1,104 @@
+import collections
+import collections.abc
+import itertools
+import unittest
+
+from fluentflow import Flows
+
+
+_BOUNDS = [None, -7, -3, -1, 0, 1, 2, 5, 11]
+_STEPS = [None, 1, 2, 3, -1, -2]
+
+
+def _get_data():
+    for x in range(10):
+        yield x
+
+
+class TestSliceMatchesPython(unittest.TestCase):
+
+    def test_every_slice(self):
+        data = list(range(10))
+        flows = [
+            Flows.create(data),
+            Flows.create(tuple(data)),
+            Flows.create(range(10)),
+            Flows.create(collections.deque(data)),
+            Flows.calling(_get_data),
+        ]
+        for start, stop, step in itertools.product(_BOUNDS, _BOUNDS, _STEPS):
+            for flow in flows:
+                self.assertEqual(
+                    data[start:stop:step],
+                    flow.slice(start, stop, step).to_list(),
+                    msg=f'{flow._data!r}[{start}:{stop}:{step}]',
+                )
+
+    def test_chained_slices(self):
+        data = list(range(100))
+        expected = data[10:][:50][::3][1:-2]
+        for flow in (Flows.create(data), Flows.calling(lambda: iter(data))):
+            self.assertEqual(expected, flow.skip(10).limit(50).slice(step=3).slice(1, -2).to_list())
+
+
+class TestSequenceSlice(unittest.TestCase):
+
+    def test_random_access_kept(self):
+        flow = Flows.create(list(range(1000))).skip(900).slice(step=5)
+        self.assertEqual(20, flow.count())
+        self.assertEqual(905, flow.get(1))
+        self.assertEqual(995, flow.last())
+
+    def test_chained_slices_fold(self):
+        data = list(range(100))
+        view = Flows.create(data).skip(10).limit(50).slice(step=3)._data
+        self.assertIs(data, view._parent)
+
+    def test_range_sliced_natively(self):
+        self.assertEqual(range(10, 20, 2), Flows.create(range(100)).slice(10, 20, 2)._data)
+
+    def test_long_slices_copied_in_chunks(self):
+        data = list(range(5000))
+        for start, stop, step in [(None, None, 1), (3, None, 7), (None, None, -1), (4000, 10, -3), (-1, None, -1)]:
+            view = Flows.create(data).slice(start, stop, step)._data
+            self.assertEqual(data[start:stop:step], list(view))
+            self.assertEqual(data[start:stop:step][::-1], list(reversed(view)))
+
+    def test_linear_time_sequences_not_viewed(self):
+        # Indexing a deque walks it, so a view would take quadratic time to go through
+        data = collections.deque(range(100))
+        sliced = Flows.create(data).slice(10, 20)._data
+        self.assertNotIsInstance(sliced, collections.abc.Sequence)
+        self.assertEqual(list(range(10, 20)), list(sliced))
+
+    def test_view_follows_changes(self):
+        data = list(range(10))
+        flow = Flows.create(data).slice(-3)
+        self.assertEqual([7, 8, 9], flow.to_list())
+        data.append(10)
+        self.assertEqual([8, 9, 10], flow.to_list())
+
+
+class TestIterableSlice(unittest.TestCase):
+
+    def test_chained_slices_fold(self):
+        flow = Flows.calling(_get_data)
+        source = flow._data
+        sliced = flow.skip(1).limit(8).slice(step=2)._data
+        self.assertIs(source, sliced._parent)
+        self.assertEqual([1, 3, 5, 7], list(sliced))
+
+    def test_negative_bounds_use_bounded_buffers(self):
+        Flows.configure(memory_limit=1000)
+        try:
+            flow = Flows.calling(lambda: iter(range(100000)))
+            self.assertEqual([99997, 99998, 99999], flow.slice(-3).to_list())
+            self.assertEqual(99997, flow.slice(stop=-3).count())
+            self.assertEqual([99999, 99998], flow.slice(stop=-3, step=-1).limit(2).to_list())
+            self.assertEqual([5, 4, 3, 2, 1, 0], flow.slice(5, None, -1).to_list())
+        finally:
+            Flows.configure(memory_limit=None)
+
+    def test_iterable_reusable(self):
+        flow = Flows.calling(_get_data).slice(2, -2)
+        self.assertEqual(flow.to_list(), flow.to_list())
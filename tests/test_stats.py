@@ -0,0 +1,143 @@
+import bisect
+import random
+import statistics
+import unittest
+
+from fluentflow import Flows, EmptyFlowError, TDigest, KLLSketch
+
+
+class TestStats(unittest.TestCase):
+
+    def test_stats(self):
+        data = [2.5, 3, -1, 10, 4.25, 3]
+        result = Flows.create(data).stats()
+        self.assertEqual(len(data), result.count)
+        self.assertEqual(sum(data), result.sum)
+        self.assertEqual(-1, result.min)
+        self.assertEqual(10, result.max)
+        self.assertAlmostEqual(statistics.mean(data), result.mean)
+        self.assertAlmostEqual(statistics.variance(data), result.variance)
+        self.assertAlmostEqual(statistics.pvariance(data), result.pvariance)
+
+    def test_stats_one_pass(self):
+        calls = []
+        Flows.create(range(10)).map(lambda a: calls.append(a) or a).stats()
+        self.assertEqual(10, len(calls))
+
+    def test_merge(self):
+        left = Flows.create(range(0, 50)).stats()
+        right = Flows.create(range(50, 75)).stats()
+        merged = left.merge(right)
+        whole = list(range(75))
+        self.assertEqual(75, merged.count)
+        self.assertEqual(sum(whole), merged.sum)
+        self.assertEqual(0, merged.min)
+        self.assertEqual(74, merged.max)
+        self.assertAlmostEqual(statistics.mean(whole), merged.mean)
+        self.assertAlmostEqual(statistics.variance(whole), merged.variance)
+
+    def test_empty(self):
+        self.assertRaises(EmptyFlowError, lambda: Flows.empty().stats())
+
+    def test_variance_needs_two(self):
+        self.assertRaises(ValueError, lambda: Flows.of(1).stats().variance)
+
+
+class TestQuantiles(unittest.TestCase):
+
+    def test_exact(self):
+        data = [7, 1, 3, 5, 9]
+        self.assertEqual([1, 4, 5, 9], Flows.create(data).quantiles([0, 0.375, 0.5, 1]))
+
+    def test_exact_matches_statistics(self):
+        data = [random.Random(1).random() for _ in range(101)]
+        expected = statistics.quantiles(data, n=4, method='inclusive')
+        actual = Flows.create(data).quantiles([0.25, 0.5, 0.75])
+        for e, a in zip(expected, actual):
+            self.assertAlmostEqual(e, a)
+
+    def test_sketches_are_close(self):
+        rng = random.Random(42)
+        data = sorted(rng.gauss(0, 1) for _ in range(20000))
+        qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+        for method, options in (('tdigest', {}), ('kll', {'rng': random.Random(7)})):
+            approx = Flows.create(data).quantiles(qs, method=method, **options)
+            for q, a in zip(qs, approx):
+                # Compare ranks rather than values, since values spread out in the tails
+                rank = bisect.bisect_left(data, a) / len(data)
+                self.assertAlmostEqual(q, rank, delta=0.015, msg=method)
+
+    def test_sketches_are_bounded(self):
+        digest = Flows.create(range(100000)).quantile_sketch('tdigest', compression=50)
+        self.assertLessEqual(len(digest._means), 100)
+
+        kll = Flows.create(range(100000)).quantile_sketch('kll', k=50, rng=random.Random(1))
+        self.assertLessEqual(sum(len(level) for level in kll._levels), 4 * 50)
+
+    def test_sketches_merge(self):
+        rng = random.Random(3)
+        data = [rng.random() for _ in range(20000)]
+
+        for method, options in (('tdigest', {}), ('kll', {'rng': random.Random(5)})):
+            left = Flows.create(data[:5000]).quantile_sketch(method, **options)
+            right = Flows.create(data[5000:]).quantile_sketch(method, **options)
+            merged = left.merge(right)
+            self.assertEqual(20000, len(merged))
+            self.assertAlmostEqual(0.5, merged.quantile(0.5), delta=0.03, msg=method)
+            self.assertAlmostEqual(0.9, merged.quantile(0.9), delta=0.03, msg=method)
+            self.assertEqual(min(data), merged.quantile(0))
+            self.assertEqual(max(data), merged.quantile(1))
+
+    def test_tdigest_count_matches_weights(self):
+        digest = TDigest()
+        for x in range(3000):
+            digest.add(x)
+        merged = digest.merge(Flows.create(range(1000)).quantile_sketch('tdigest')).merge(TDigest())
+        merged._compress()
+        self.assertEqual(4000, len(merged))
+        self.assertEqual(4000, sum(merged._weights))
+
+    def test_kll_seeded_is_reproducible(self):
+        data = list(range(10000))
+        first = Flows.create(data).quantiles([0.3], method='kll', k=20, rng=random.Random(9))
+        second = Flows.create(data).quantiles([0.3], method='kll', k=20, rng=random.Random(9))
+        self.assertEqual(first, second)
+
+    def test_single_value(self):
+        self.assertEqual([4.0, 4.0], Flows.of(4.0).quantiles([0.1, 0.9], method='tdigest'))
+        self.assertEqual([4.0], TDigest().merge(Flows.of(4.0).quantile_sketch()).quantiles([0.5]))
+
+    def test_empty(self):
+        self.assertRaises(EmptyFlowError, lambda: Flows.empty().quantiles([0.5]))
+        self.assertRaises(EmptyFlowError, lambda: Flows.empty().quantiles([0.5], method='kll'))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, lambda: Flows.of(1).quantiles([1.5]))
+        self.assertRaises(ValueError, lambda: Flows.of(1).quantiles([0.5], method='median'))
+        self.assertRaises(ValueError, lambda: KLLSketch(k=1))
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_equal_bins(self):
+        counts, edges = Flows.create([0, 1, 1, 2, 3, 4]).histogram(4)
+        self.assertEqual([1, 2, 1, 2], counts)
+        self.assertEqual([0, 1, 2, 3, 4], edges)
+
+    def test_range(self):
+        counts, edges = Flows.create([-5, 0, 1, 9, 10, 11]).histogram(2, range=(0, 10))
+        self.assertEqual([2, 2], counts)
+        self.assertEqual([0, 5, 10], edges)
+
+    def test_edges(self):
+        counts, edges = Flows.create([0.5, 1, 2.5, 7]).histogram([0, 1, 5])
+        self.assertEqual([1, 2], counts)
+
+    def test_one_value(self):
+        counts, edges = Flows.of(3, 3).histogram(1)
+        self.assertEqual([2], counts)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, lambda: Flows.of(1).histogram(0))
+        self.assertRaises(ValueError, lambda: Flows.of(1).histogram([2, 1]))
@@ -0,0 +1,157 @@
+import threading
+import unittest
+
+from fluentflow import Flows
+
+
+class FakeClock:
+    '''A clock that only moves when something sleeps or when a test advances it.'''
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now = self.now + seconds
+
+
+class TestThrottle(unittest.TestCase):
+
+    def test_throttle_spaces_out_elements(self):
+        clock = FakeClock()
+        times = []
+        Flows.create(range(5)).throttle(10, clock=clock, sleep=clock.sleep).for_each(lambda a: times.append(clock.now))
+
+        expected = [0.0, 0.1, 0.2, 0.3, 0.4]
+        self.assertEqual(len(expected), len(times))
+        for expected_time, actual_time in zip(expected, times):
+            self.assertAlmostEqual(expected_time, actual_time)
+
+    def test_throttle_inexact_rates_finish(self):
+        # 1/10 and 1/3 are not exact in binary, so refills can fall a hair short of a whole token
+        for rate in (10, 3, 7):
+            clock = FakeClock()
+            self.assertEqual(50, Flows.create(range(50)).throttle(rate, clock=clock, sleep=clock.sleep).count())
+            self.assertEqual(49, len(clock.sleeps))
+            self.assertAlmostEqual(49 / rate, clock.now)
+
+    def test_throttle_burst(self):
+        clock = FakeClock()
+        times = []
+        Flows.create(range(5)).throttle(2, per=1.0, burst=3, clock=clock, sleep=clock.sleep).for_each(lambda a: times.append(clock.now))
+
+        expected = [0.0, 0.0, 0.0, 0.5, 1.0]
+        for expected_time, actual_time in zip(expected, times):
+            self.assertAlmostEqual(expected_time, actual_time)
+
+    def test_throttle_refills_while_idle(self):
+        clock = FakeClock()
+
+        def _slow_source():
+            for x in range(3):
+                clock.now = clock.now + 1.0
+                yield x
+
+        self.assertEqual([0, 1, 2], Flows.calling(_slow_source).throttle(1, clock=clock, sleep=clock.sleep).to_list())
+        self.assertEqual([], clock.sleeps)
+
+    def test_throttle_restarts_per_iteration(self):
+        clock = FakeClock()
+        flow = Flows.create(range(2)).throttle(1, per=2.0, clock=clock, sleep=clock.sleep)
+        self.assertEqual([0, 1], flow.to_list())
+        self.assertEqual([0, 1], flow.to_list())
+        self.assertEqual(2, len(clock.sleeps))
+        self.assertAlmostEqual(2.0, clock.sleeps[0])
+
+    def test_throttle_invalid(self):
+        self.assertRaises(ValueError, lambda: Flows.empty().throttle(0))
+        self.assertRaises(ValueError, lambda: Flows.empty().throttle(1, per=0))
+        self.assertRaises(ValueError, lambda: Flows.empty().throttle(1, burst=0))
+
+
+class TestDebounce(unittest.TestCase):
+
+    def _arriving_at(self, clock, times):
+        def _get_data():
+            for index, time in enumerate(times):
+                clock.now = time
+                yield index
+        return Flows.calling(_get_data)
+
+    def test_debounce(self):
+        clock = FakeClock()
+        flow = self._arriving_at(clock, [0.0, 0.1, 0.2, 1.0, 2.5, 2.6])
+        self.assertEqual([2, 3, 5], flow.debounce(0.5, clock=clock).to_list())
+
+    def test_debounce_empty(self):
+        self.assertEqual([], Flows.empty().debounce(1.0, clock=FakeClock()).to_list())
+
+    def test_debounce_invalid(self):
+        self.assertRaises(ValueError, lambda: Flows.empty().debounce(-1))
+
+
+class TestBuffer(unittest.TestCase):
+
+    def test_sync_buffer_reads_in_batches(self):
+        read = []
+        seen = []
+
+        def _get_data():
+            for x in range(7):
+                read.append(x)
+                yield x
+
+        def _consume(x):
+            seen.append((x, len(read)))
+
+        Flows.calling(_get_data).buffer(3, threaded=False).for_each(_consume)
+        self.assertEqual([(0, 3), (1, 3), (2, 3), (3, 6), (4, 6), (5, 6), (6, 7)], seen)
+
+    def test_threaded_buffer_applies_backpressure(self):
+        read = []
+        ahead = threading.Event()
+
+        def _get_data():
+            for x in range(100):
+                read.append(x)
+                if len(read) == 7:
+                    ahead.set()
+                yield x
+
+        it = iter(Flows.calling(_get_data).buffer(5))
+        self.assertEqual(0, next(it))
+
+        # One element taken, five in the buffer, and one waiting to go in: the producer cannot get further than this
+        self.assertTrue(ahead.wait(5))
+        self.assertEqual(7, len(read))
+
+        self.assertEqual(list(range(1, 100)), list(it))
+
+    def test_threaded_buffer_propagates_errors(self):
+        def _get_data():
+            yield 1
+            raise KeyError('boom')
+
+        it = iter(Flows.calling(_get_data).buffer(5))
+        self.assertEqual(1, next(it))
+        self.assertRaises(KeyError, lambda: next(it))
+
+    def test_threaded_buffer_stops_producer_early(self):
+        done = threading.Event()
+
+        def _get_data():
+            try:
+                for x in range(1000):
+                    yield x
+            finally:
+                done.set()
+
+        self.assertEqual([0, 1, 2], Flows.calling(_get_data).buffer(2).limit(3).to_list())
+        self.assertTrue(done.wait(5))
+
+    def test_buffer_invalid(self):
+        self.assertRaises(ValueError, lambda: Flows.empty().buffer(0))